@@ -6,186 +6,273 @@ import numpy as np
 import logging
 import threading
 import time
-from collections import deque
+import subprocess
 import wave
 import sys
+from fractions import Fraction
+from scipy.signal import resample_poly
+
+from ssdigi_modem.core.dsp_kernels import prepare_tx
+from ssdigi_modem.core.ring_buffer import RingBuffer, next_pow2
+
+try:
+    import rtmixer  # Optional: services the ring buffers from a C-level callback
+except ImportError:
+    rtmixer = None
+
+try:
+    import soundfile  # Optional: decodes WAV variants the wave module cannot
+except ImportError:
+    soundfile = None
 
 logger = logging.getLogger(__name__)
 
+# Seconds before a cached device enumeration is rescanned to pick up hot-plugged devices
+_DEVICE_CACHE_TTL = 30.0
+
 class AudioManager:
     """Audio device management for SSDigi Modem"""
 
+    # Fixed attribute layout: faster lookups on the callback path and no per-instance __dict__
+    __slots__ = (
+        'config', 'audio', 'linux', '_devices', '_host_apis', '_devices_stamp', '_device_lists',
+        'input_stream', 'output_stream', 'mixer', '_record_action', '_play_action',
+        'input_device', 'output_device', 'sample_rate', 'channels', 'buffer_size', 'low_latency',
+        'recording', 'playing', 'input_buffer', 'output_buffer', 'rx_buffer', '_pending_load', '_loaded_frames', '_record_lock',
+        '_pa_lock',
+        '_chunk_samples', '_chunk_bytes', '_out_block', '_silence_bytes', '_tx_level', '_tx_level_rev',
+        'audio_thread', 'audio_thread_running', '_data_ready',
+    )
+
     def __init__(self, config):
         """Initialize audio manager"""
         self.config = config
         self.audio = pyaudio.PyAudio()
+        # Held while self.audio is re-initialized, queried or used to open/close streams
+        self._pa_lock = threading.RLock()
 
         #if linux vhoose ALSA
         self.linux = sys.platform.startswith('linux')
 
+        self._devices = None
+        self._host_apis = []
+        self._devices_stamp = 0.0
+        self._device_lists = {}  # Memoized get_input_devices/get_output_devices results
         self.input_stream = None
         self.output_stream = None
+        self.mixer = None
+        self._record_action = None
+        self._play_action = None
         self.input_device = None
         self.output_device = None
         self.sample_rate = config.get('audio', 'sample_rate')
         self.channels = config.get('audio', 'channels')
         self.buffer_size = config.get('audio', 'buffer_size')
 
-        # Audio processing
+        # Audio processing - lock-free rings of float32 frames shared with the audio callback
         self.recording = False
         self.playing = False
-        self.input_buffer = deque(maxlen=1000)  # Store ~20 seconds at 48kHz
-        self.output_buffer = deque(maxlen=1000)        # Initialize the audio processing thread
+        ring_class = rtmixer.RingBuffer if rtmixer is not None else RingBuffer
+        ring_size = next_pow2(1000 * self.buffer_size)  # Store ~20 seconds at 48kHz
+        self.input_buffer = ring_class(4 * self.channels, ring_size)
+        self.output_buffer = ring_class(4 * self.channels, ring_size)
+
+        # Bounded SPSC queue of captured frames: the audio callback only copies into
+        # rx_buffer, the processing thread drains it. While that thread runs it is also
+        # the only writer of input_buffer, so loaded audio is handed to it
+        queue_size = next_pow2(8 * self.buffer_size)
+        self.rx_buffer = ring_class(4 * self.channels, queue_size)
+        self._pending_load = None
+        self._loaded_frames = 0
+
+        # Held while the processing thread drops and writes recorded frames and while
+        # readers copy them out, so a copy never spans a block being overwritten
+        self._record_lock = threading.Lock()
+        self._refresh_cached_params()
+
+        # Initialize the audio processing thread, woken once a full block has been captured
         self.audio_thread = None
         self.audio_thread_running = False
+        self._data_ready = threading.Event()
+
+        # Low-latency mode swaps the configured block size for a small one after the
+        # rings above have been sized for the configured one
+        self.low_latency = False
+        if config.get('audio', 'low_latency', False):
+            self.set_latency_mode(True)
+
+    def set_latency_mode(self, low, bandwidth=None):
+        """Switch between the configured block size and a small bandwidth-derived one
+
+        Args:
+            low: True for low-latency mode, False for the configured buffer_size
+            bandwidth: Modem bandwidth in Hz (defaults to the configured bandwidth)
+
+        Returns:
+            bool: True if the new mode is in effect
+        """
+        self.low_latency = bool(low)
+        if self.low_latency:
+            if bandwidth is None:
+                bandwidth = self.config.get('modem', 'bandwidth', 500)
+            buffer_size = self._low_latency_block(bandwidth)
+        else:
+            buffer_size = self.config.get('audio', 'buffer_size')
+
+        if buffer_size == self.buffer_size:
+            return True
+
+        # Reopen the streams with the new block size if they are running
+        running = self.audio_thread_running
+        if running:
+            self.stop()
+        self.buffer_size = buffer_size
+        self._refresh_cached_params()
+        logger.info(f"Audio block size set to {buffer_size} frames (low latency: {self.low_latency})")
+        return self.start() if running else True
+
+    def _low_latency_block(self, bandwidth):
+        """Get a block size of about eight cycles of the modem bandwidth, capped at buffer_size"""
+        frames = next_pow2(8 * self.sample_rate // max(1, int(bandwidth)))
+        return max(64, min(frames, self.config.get('audio', 'buffer_size')))
+
+    def _refresh_cached_params(self):
+        """Precompute stream constants so the audio paths never recompute or look them up"""
+        self._chunk_samples = self.buffer_size * self.channels
+        self._chunk_bytes = 4 * self._chunk_samples
+        self._out_block = np.zeros(self._chunk_samples, dtype=np.float32)
+        self._silence_bytes = bytes(self._chunk_bytes)
+        self._refresh_tx_level()
+
+    def _refresh_tx_level(self):
+        """Re-read the TX level, remembering the config revision it was read at"""
+        self._tx_level = self.config.get('modem', 'tx_level', 1.0)
+        self._tx_level_rev = self.config.revision
 
     def __del__(self):
         """Cleanup audio resources"""
         self.close()
 
-    def get_input_devices(self):
-        """Get list of available input devices"""
+    def _device_table(self):
+        """Get PyAudio's host API and device info, enumerated once and cached
+
+        Each info query can round-trip to the OS audio service, and PortAudio's device
+        list does not change until it is re-initialized (see refresh_devices). Once the
+        cache is older than _DEVICE_CACHE_TTL it is only re-queried here; this may run
+        on a worker thread, so PortAudio itself is never re-initialized from it.
+        """
+        with self._pa_lock:
+            if self._devices is not None and time.monotonic() - self._devices_stamp > _DEVICE_CACHE_TTL:
+                self._devices = None
+
+            if self._devices is None:
+                self._host_apis = [self.audio.get_host_api_info_by_index(i)
+                                   for i in range(self.audio.get_host_api_count())]
+                devices = []
+                for i in range(self.audio.get_device_count()):
+                    try:
+                        devices.append(self.audio.get_device_info_by_index(i))
+                    except Exception as e:
+                        logger.warning(f"Error accessing audio device {i}: {e}")
+                self._devices = devices
+                self._devices_stamp = time.monotonic()
+                self._device_lists = {}
+        return self._devices
+
+    def _select_host_api(self, *names):
+        """Get the index of the first host API whose name contains any of names (default 0)"""
+        self._device_table()
+        for i, api_info in enumerate(self._host_apis):
+            api_name = api_info['name'].lower()
+            if any(name in api_name for name in names):
+                return i
+        return 0
+
+    def _list_devices(self, host_api_index, channels_key):
+        """Get (name, global index) pairs for a host API's devices with channels_key > 0"""
+        candidates = [info for info in self._device_table() if info[channels_key] > 0]
+
+        # Fall back to every host API if the selected one has no suitable devices
+        on_host_api = [info for info in candidates if info['hostApi'] == host_api_index]
+        if on_host_api:
+            candidates = on_host_api
+        else:
+            logger.warning(f"No devices found on host API {host_api_index}, using all host APIs")
+
         devices = []
-        seen_names = set()
+        for info in candidates:
+            name = info['name'].strip()
+
+            # Skip default entries - we already have "System Default"
+            if "default" in name.lower():
+                continue
+
+            devices.append((name, info['index']))  # Use the global device index
+        return devices
 
-        # Get available host APIs
-        host_api_count = self.audio.get_host_api_count()
-        host_api_index = 0  # Default to first host API
+    def refresh_devices(self):
+        """Re-enumerate audio devices on the next query
+
+        PortAudio only rescans the hardware when re-initialized, which is done here
+        while no stream is open. Call it from the GUI thread only; the lock keeps it
+        from overlapping device queries and stream opening on other threads.
+        """
+        with self._pa_lock:
+            self._devices = None
+            self._device_lists = {}
+            if self.input_stream is None and self.output_stream is None and self.mixer is None:
+                self.audio.terminate()
+                self.audio = pyaudio.PyAudio()
+
+    def get_input_devices(self):
+        """Get list of available input devices"""
+        self._device_table()
+        cached = self._device_lists.get('input')
+        if cached is not None:
+            return list(cached)
 
         # Choose appropriate host API based on OS
         if self.linux:
-            # Try to find ALSA host API
-            for i in range(host_api_count):
-                api_info = self.audio.get_host_api_info_by_index(i)
-                if api_info['name'].lower().find('alsa') >= 0:
-                    host_api_index = i
-                    break
+            host_api_index = self._select_host_api('alsa')
         else:
             # For Windows, use the Windows DirectSound API to match Windows device indexing
-            for i in range(host_api_count):
-                api_info = self.audio.get_host_api_info_by_index(i)
-                if api_info['name'].lower().find('directsound') >= 0:
-                    host_api_index = i
-                    break
+            host_api_index = self._select_host_api('directsound')
 
-        logger.info(f"Using host API index {host_api_index}: {self.audio.get_host_api_info_by_index(host_api_index)['name']}")
+        logger.info(f"Using host API index {host_api_index}: {self._host_apis[host_api_index]['name']}")
 
-        # Get devices for the selected host API
-        try:
-            api_info = self.audio.get_host_api_info_by_index(host_api_index)
-            device_count = api_info['deviceCount']
-
-            # Track microphone names to avoid duplicates
-            for i in range(device_count):
-                try:
-                    # Use correct method name to get device info
-                    device_info = self.audio.get_device_info_by_host_api_device_index(host_api_index, i)
-
-                    if device_info['maxInputChannels'] > 0:
-                        name = device_info['name'].strip()
-
-                        # Skip default entries - we already have "System Default"
-                        if "default" in name.lower():
-                            continue
-
-                        # Add device to our list
-                        seen_names.add(name)
-                        devices.append((name, device_info['index']))  # Use the global device index
-                except Exception as e:
-                    logger.warning(f"Error accessing input device {i}: {e}")
-                    continue
-        except Exception as e:
-            logger.error(f"Error getting input devices from host API {host_api_index}: {e}")
-            # Fallback to direct device access if host API method fails
-            for i in range(self.audio.get_device_count()):
-                try:
-                    device_info = self.audio.get_device_info_by_index(i)
-                    if device_info['maxInputChannels'] > 0:
-                        name = device_info['name'].strip()
-                        if "default" in name.lower():
-                            continue
-                        seen_names.add(name)
-                        devices.append((name, i))
-                except Exception:
-                    continue
+        devices = self._list_devices(host_api_index, 'maxInputChannels')
 
         logger.info(f"Found {len(devices)} input devices")
         for name, index in devices:
             logger.info(f"Input device: {name} (index: {index})")
 
+        self._device_lists['input'] = tuple(devices)
         return devices
 
     def get_output_devices(self):
         """Get list of available output devices"""
-        devices = []
-        seen_names = set()
+        self._device_table()
+        cached = self._device_lists.get('output')
+        if cached is not None:
+            return list(cached)
 
         # Add only one system default at index -1 (will be 0 when no specific device is selected)
-        devices.append(("System Default", -1))
-
-        # Get available host APIs
-        host_api_count = self.audio.get_host_api_count()
-        host_api_index = 0  # Default to first host API
+        devices = [("System Default", -1)]
 
         # Choose appropriate host API based on OS
         if self.linux:
-            # Try to find ALSA host API
-            for i in range(host_api_count):
-                api_info = self.audio.get_host_api_info_by_index(i)
-                if api_info['name'].lower().find('alsa') >= 0:
-                    host_api_index = i
-                    break
+            host_api_index = self._select_host_api('alsa')
         else:
             # For Windows, try to use WASAPI or DirectSound
-            for i in range(host_api_count):
-                api_info = self.audio.get_host_api_info_by_index(i)
-                if api_info['name'].lower().find('wasapi') >= 0 or api_info['name'].lower().find('directsound') >= 0:
-                    host_api_index = i
-                    break
+            host_api_index = self._select_host_api('wasapi', 'directsound')
 
-        # Get devices for the selected host API
-        try:
-            api_info = self.audio.get_host_api_info_by_index(host_api_index)
-            device_count = api_info['deviceCount']
-
-            # Track speaker names to avoid duplicates
-            for i in range(device_count):
-                try:
-                    # Use correct method name to get device info
-                    device_info = self.audio.get_device_info_by_host_api_device_index(host_api_index, i)
-
-                    if device_info['maxOutputChannels'] > 0:
-                        name = device_info['name'].strip()
-
-                        # Skip default entries - we already have "System Default"
-                        if "default" in name.lower():
-                            continue
-
-                        # Add device to our list
-                        seen_names.add(name)
-                        devices.append((name, device_info['index']))  # Use the global device index
-                except Exception as e:
-                    logger.warning(f"Error accessing output device {i}: {e}")
-                    continue
-        except Exception as e:
-            logger.error(f"Error getting output devices from host API {host_api_index}: {e}")
-            # Fallback to direct device access if host API method fails
-            for i in range(self.audio.get_device_count()):
-                try:
-                    device_info = self.audio.get_device_info_by_index(i)
-                    if device_info['maxOutputChannels'] > 0:
-                        name = device_info['name'].strip()
-                        if "default" in name.lower():
-                            continue
-                        seen_names.add(name)
-                        devices.append((name, i))
-                except Exception:
-                    continue
+        devices.extend(self._list_devices(host_api_index, 'maxOutputChannels'))
 
         logger.info(f"Found {len(devices)} output devices")
         for name, index in devices:
             logger.info(f"Output device: {name} (index: {index})")
 
+        self._device_lists['output'] = tuple(devices)
         return devices
 
     def set_devices(self, input_device_index, output_device_index):
@@ -199,10 +286,12 @@ class AudioManager:
             self.config.set('audio', 'input_device', input_device_index)
             self.config.set('audio', 'output_device', output_device_index)
             self.config.save()
+            self._refresh_cached_params()
 
             # Log device info
-            input_info = self.audio.get_device_info_by_index(input_device_index)
-            output_info = self.audio.get_device_info_by_index(output_device_index)
+            with self._pa_lock:
+                input_info = self.audio.get_device_info_by_index(input_device_index)
+                output_info = self.audio.get_device_info_by_index(output_device_index)
 
             logger.info(f"Input device set to: {input_info['name']}")
             logger.info(f"Output device set to: {output_info['name']}")
@@ -243,8 +332,9 @@ class AudioManager:
         if not self.audio_thread_running:
             return
 
-        # Stop the audio thread
+        # Stop the audio thread, waking it so it notices immediately
         self.audio_thread_running = False
+        self._data_ready.set()
         if self.audio_thread:
             self.audio_thread.join(timeout=1.0)
 
@@ -252,8 +342,10 @@ class AudioManager:
         self._close_streams()
 
         # Clear buffers
-        self.input_buffer.clear()
-        self.output_buffer.clear()
+        with self._record_lock:
+            self.input_buffer.flush()
+        self.output_buffer.flush()
+        self.rx_buffer.flush()
 
         logger.info("Audio processing stopped")
 
@@ -268,55 +360,110 @@ class AudioManager:
 
     def _open_streams(self):
         """Open audio input and output streams"""
-        try:
-            # Close any existing streams
-            self._close_streams()
+        with self._pa_lock:
+            try:
+                # Close any existing streams
+                self._close_streams()
+
+                # Prefer rtmixer so no Python code runs on the audio thread
+                if rtmixer is not None:
+                    return self._open_mixer()
+
+                # Open input stream
+                if self.input_device is not None:
+                    self.input_stream = self.audio.open(
+                        format=pyaudio.paFloat32,
+                        channels=self.channels,
+                        rate=self.sample_rate,
+                        input=True,
+                        input_device_index=self.input_device,
+                        frames_per_buffer=self.buffer_size,
+                        stream_callback=self._input_callback
+                    )
+
+                # Open output stream
+                if self.output_device is not None:
+                    self.output_stream = self.audio.open(
+                        format=pyaudio.paFloat32,
+                        channels=self.channels,
+                        rate=self.sample_rate,
+                        output=True,
+                        output_device_index=self.output_device,
+                        frames_per_buffer=self.buffer_size,
+                        stream_callback=self._output_callback
+                    )
+
+                return True
 
-            # Open input stream
-            if self.input_device is not None:
-                self.input_stream = self.audio.open(
-                    format=pyaudio.paFloat32,
-                    channels=self.channels,
-                    rate=self.sample_rate,
-                    input=True,
-                    input_device_index=self.input_device,
-                    frames_per_buffer=self.buffer_size,
-                    stream_callback=self._input_callback
-                )
-
-            # Open output stream
-            if self.output_device is not None:
-                self.output_stream = self.audio.open(
-                    format=pyaudio.paFloat32,
-                    channels=self.channels,
-                    rate=self.sample_rate,
-                    output=True,
-                    output_device_index=self.output_device,
-                    frames_per_buffer=self.buffer_size,
-                    stream_callback=self._output_callback
-                )
+            except Exception as e:
+                logger.error(f"Error opening audio streams: {e}")
+                self._close_streams()
+                return False
 
+    def _open_mixer(self):
+        """Open an rtmixer stream that exchanges samples through the ring buffers"""
+        if self.input_device is not None and self.output_device is not None:
+            mixer_class = rtmixer.MixerAndRecorder
+            device = (self._stream_device(self.input_device), self._stream_device(self.output_device))
+        elif self.input_device is not None:
+            mixer_class = rtmixer.Recorder
+            device = self._stream_device(self.input_device)
+        elif self.output_device is not None:
+            mixer_class = rtmixer.Mixer
+            device = self._stream_device(self.output_device)
+        else:
             return True
 
-        except Exception as e:
-            logger.error(f"Error opening audio streams: {e}")
-            self._close_streams()
-            return False
+        self.mixer = mixer_class(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            blocksize=self.buffer_size,
+            latency='low' if self.low_latency else 'high',
+            device=device
+        )
+        self.mixer.start()
+
+        # Capture continuously into the DSP queue and resume any active playback
+        if hasattr(self.mixer, 'record_ringbuffer'):
+            self._record_action = self.mixer.record_ringbuffer(self.rx_buffer)
+        if self.playing and hasattr(self.mixer, 'play_ringbuffer'):
+            self._play_action = self.mixer.play_ringbuffer(self.output_buffer)
+
+        logger.info(f"Opened rtmixer stream on device {device}")
+        return True
+
+    @staticmethod
+    def _stream_device(index):
+        """Map a stored device index to a sounddevice device (negative means system default)"""
+        return None if index < 0 else index
+
+    def _cancel_action(self, action):
+        """Cancel an rtmixer action and wait until the audio callback has dropped it"""
+        if self.mixer is not None and action is not None and action in self.mixer.actions:
+            self.mixer.wait(self.mixer.cancel(action))
 
     def _close_streams(self):
         """Close audio streams"""
-        try:
-            if self.input_stream:
-                self.input_stream.stop_stream()
-                self.input_stream.close()
-                self.input_stream = None
-
-            if self.output_stream:
-                self.output_stream.stop_stream()
-                self.output_stream.close()
-                self.output_stream = None
-        except Exception as e:
-            logger.error(f"Error closing audio streams: {e}")
+        with self._pa_lock:
+            try:
+                if self.mixer is not None:
+                    self.mixer.stop()
+                    self.mixer.close()
+                    self.mixer = None
+                    self._record_action = None
+                    self._play_action = None
+
+                if self.input_stream:
+                    self.input_stream.stop_stream()
+                    self.input_stream.close()
+                    self.input_stream = None
+
+                if self.output_stream:
+                    self.output_stream.stop_stream()
+                    self.output_stream.close()
+                    self.output_stream = None
+            except Exception as e:
+                logger.error(f"Error closing audio streams: {e}")
 
     def refresh_audio_devices(self):
         """Refresh audio devices"""
@@ -340,12 +487,10 @@ class AudioManager:
         if status:
             logger.warning(f"Input stream status: {status}")
 
-        if self.recording:
-            # Convert byte data to numpy array
-            audio_data = np.frombuffer(in_data, dtype=np.float32)
-
-            # Store in input buffer
-            self.input_buffer.append(audio_data.copy())
+        # Copy raw samples straight into the DSP queue, no per-callback allocation
+        self.rx_buffer.write(in_data)
+        if self.rx_buffer.read_available >= self.buffer_size:
+            self._data_ready.set()
 
         return None, pyaudio.paContinue
 
@@ -354,33 +499,56 @@ class AudioManager:
         if status:
             logger.warning(f"Output stream status: {status}")
 
-        if self.playing and len(self.output_buffer) > 0:
-            # Get data from output buffer
-            audio_data = self.output_buffer.popleft()
-
-            # Ensure correct frame count
-            if len(audio_data) < frame_count * self.channels:
-                # Pad with zeros if needed
-                padding = np.zeros(frame_count * self.channels - len(audio_data), dtype=np.float32)
-                audio_data = np.concatenate((audio_data, padding))
-            elif len(audio_data) > frame_count * self.channels:
-                # Truncate if too large
-                audio_data = audio_data[:frame_count * self.channels]
+        if self.playing and self.output_buffer.read_available > 0:
+            # Read straight into the preallocated output block and zero whatever the ring
+            # could not fill; one assign covers both the short and the full case
+            block = self._out_block if frame_count == self.buffer_size else self._out_block[:frame_count * self.channels]
+            read = self.output_buffer.readinto(block)
+            block[read * self.channels:] = 0
 
-            return audio_data.tobytes(), pyaudio.paContinue
+            return block.tobytes(), pyaudio.paContinue
         else:
-            # Return silence if no data available
-            return np.zeros(frame_count * self.channels, dtype=np.float32).tobytes(), pyaudio.paContinue
+            # Return silence if no data available, reusing the cached block when sizes match
+            if frame_count == self.buffer_size:
+                return self._silence_bytes, pyaudio.paContinue
+            return bytes(4 * frame_count * self.channels), pyaudio.paContinue
 
     def _audio_processing_loop(self):
         """Audio processing thread"""
         try:
+            # Preallocate the per-block work buffer once for the lifetime of the thread
+            in_buf = np.zeros(self._chunk_samples, dtype=np.float32)
+
+            # The PyAudio callback signals each full block, so the timeout only bounds shutdown
+            # latency; rtmixer has no Python callback, so poll once per block period instead
+            idle_timeout = self.buffer_size / self.sample_rate if self.mixer is not None else 0.1
+
             while self.audio_thread_running:
-                # Process audio here (filtering, modem operations, etc.)
-                # This is where integration with the modem would occur
+                # Swap in loaded audio here so input_buffer keeps a single writer thread
+                pending = self._pending_load
+                if pending is not None:
+                    self._pending_load = None
+                    data, done = pending
+                    self._loaded_frames = self._store_input(data)
+                    done.set()
+
+                # Idle until a full block is queued; re-checking after every wake means a
+                # signal cleared here can never be lost
+                if self.rx_buffer.read_available < self.buffer_size:
+                    self._data_ready.wait(idle_timeout)
+                    self._data_ready.clear()
+                    continue
 
-                # Sleep to reduce CPU usage
-                time.sleep(0.01)
+                self.rx_buffer.readinto(in_buf)
+                if self.recording:
+                    # Readers of the recording ring only copy under _record_lock and never
+                    # advance its read index, so this thread drops the oldest frames itself
+                    # to keep the newest ~20 seconds, like a bounded deque
+                    with self._record_lock:
+                        shortfall = self.buffer_size - self.input_buffer.write_available
+                        if shortfall > 0:
+                            self.input_buffer.advance_read_index(shortfall)
+                        self.input_buffer.write(in_buf)
         except Exception as e:
             logger.error(f"Error in audio processing loop: {e}")
 
@@ -394,42 +562,107 @@ class AudioManager:
         self.recording = False
         logger.info("Recording stopped")
 
-    def get_recorded_data(self):
-        """Get recorded audio data"""
-        if not self.input_buffer:
-            return None
-
-        # Combine all buffers
-        combined_data = np.concatenate(list(self.input_buffer))
+    def _recorded_regions(self):
+        """Get the unread input ring regions as uint8 arrays without consuming them
+
+        The regions are live views; callers must hold _record_lock while reading them.
+        """
+        size, first, second = self.input_buffer.get_read_buffers(self.input_buffer.read_available)
+        return size, np.frombuffer(first, dtype=np.uint8), np.frombuffer(second, dtype=np.uint8)
+
+    def get_recorded_data(self, out=None):
+        """Get recorded audio data
+
+        Args:
+            out: Optional float32 array to fill instead of allocating a new one; must be
+                at least as large as the recording
+
+        Returns:
+            A float32 array of the recorded samples, or None if nothing was recorded
+        """
+        with self._record_lock:
+            size, first, second = self._recorded_regions()
+            if not size:
+                return None
+
+            # Copy the (at most two) ring regions straight into their slices of the result
+            samples = size * self.channels
+            combined_data = np.empty(samples, dtype=np.float32) if out is None else out[:samples]
+            raw = combined_data.view(np.uint8)
+            raw[:len(first)] = first
+            raw[len(first):] = second
         return combined_data
 
-    def play_data(self, audio_data):
-        """Play audio data"""
-        if not self.output_stream:
+    def get_latest_samples(self, count):
+        """Get a copy of up to count of the most recently recorded samples"""
+        with self._record_lock:
+            size, first, second = self._recorded_regions()
+            if not size:
+                return None
+
+            # Copy the tail of the ring, spanning the wrap point only if needed
+            tail = count * 4
+            if len(second) >= tail:
+                data = second[-tail:].copy()
+            elif len(second):
+                data = np.concatenate((first[-(tail - len(second)):], second))
+            else:
+                data = first[-tail:].copy()
+        return data.view(np.float32)
+
+    def play_data(self, audio_data, mono=False):
+        """Play audio data at the configured TX level
+
+        Args:
+            audio_data: Interleaved samples, flat or shaped (frames, channels)
+            mono: If True, audio_data is a single channel sent to every output channel
+        """
+        if not self.output_stream and not hasattr(self.mixer, 'play_ringbuffer'):
             logger.error("Output stream not available")
             return False
 
-        # Split data into buffer-sized chunks
-        chunk_size = self.buffer_size * self.channels
-        chunks = [audio_data[i:i+chunk_size] for i in range(0, len(audio_data), chunk_size)]
+        # The TX level can change through the config at any time; re-read it only if
+        # anything was set since the cached value was taken
+        if self.config.revision != self._tx_level_rev:
+            self._refresh_tx_level()
 
-        # Add to output buffer
-        for chunk in chunks:
-            self.output_buffer.append(chunk)
+        audio_data = np.asarray(audio_data).reshape(-1)
+        if mono:
+            # Upmix and apply gain in one fused pass
+            frames = np.empty((audio_data.size, self.channels), dtype=np.float32)
+            prepare_tx(np.ascontiguousarray(audio_data, dtype=np.float32), frames.reshape(-1), self._tx_level)
+        else:
+            # Convert and apply gain in one pass into whole frames, zero-padding a trailing partial frame
+            pad = (-audio_data.size) % self.channels
+            frames = np.empty(((audio_data.size + pad) // self.channels, self.channels), dtype=np.float32)
+            flat = frames.reshape(-1)
+            np.multiply(audio_data, np.float32(self._tx_level), out=flat[:audio_data.size], casting='unsafe')
+            flat[audio_data.size:] = 0
+
+        # Queue all frames in the output ring with a single copy
+        written = self.output_buffer.write(frames)
+        if written < len(frames):
+            logger.warning(f"Output buffer full, dropped {len(frames) - written} frames")
+        written *= self.channels
 
         # Start playback
         self.playing = True
-        logger.info(f"Playback started ({len(chunks)} chunks)")
+        if self.mixer is not None and self._play_action not in self.mixer.actions:
+            self._play_action = self.mixer.play_ringbuffer(self.output_buffer)
+        logger.info(f"Playback started ({written} samples)")
         return True
 
     def stop_playback(self):
         """Stop audio playback"""
         self.playing = False
-        self.output_buffer.clear()
+        self._cancel_action(self._play_action)
+        self._play_action = None
+        self.output_buffer.flush()
         logger.info("Playback stopped")
 
     def save_to_wav(self, file_path):
         """Save recorded audio to WAV file"""
+        # Copy the recording out under the lock, then write without holding it
         data = self.get_recorded_data()
         if data is None:
             logger.error("No data to save")
@@ -440,7 +673,7 @@ class AudioManager:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(4)  # 4 bytes for float32
                 wf.setframerate(self.sample_rate)
-                wf.writeframes(data.tobytes())
+                wf.writeframes(data)
 
             logger.info(f"Audio saved to {file_path}")
             return True
@@ -449,51 +682,123 @@ class AudioManager:
             logger.error(f"Error saving WAV file: {e}")
             return False
 
-    def load_from_wav(self, file_path):
-        """Load audio from WAV file"""
+    def _store_input(self, data):
+        """Replace the input ring contents with data, returning the frames stored"""
+        with self._record_lock:
+            self.input_buffer.flush()
+            return self.input_buffer.write(data)
+
+    def _replace_input(self, data):
+        """Replace the recorded audio with loaded data, returning the frames stored
+
+        Recording stops first. While the processing thread runs it is the input ring's
+        only writer, so the data is handed to it and this waits for the swap.
+        """
+        self.recording = False
+        if not self.audio_thread_running:
+            return self._store_input(data)
+
+        done = threading.Event()
+        self._pending_load = (data, done)
+        self._data_ready.set()
+        if not done.wait(1.0):
+            self._pending_load = None
+            logger.error("Audio processing thread did not take the loaded audio")
+            return 0
+        return self._loaded_frames
+
+    def _store_loaded(self, data, frames, file_path):
+        """Store loaded audio in the input ring, warning if it did not all fit"""
+        stored = self._replace_input(data)
+        if stored < frames:
+            logger.warning(f"Audio from {file_path} truncated to {stored} of {frames} frames "
+                           f"({stored / self.sample_rate:.1f} s buffer)")
+        else:
+            logger.info(f"Audio loaded from {file_path}")
+
+    def load_audio(self, file_path):
+        """Load audio from any format, decoding non-PCM files through an ffmpeg pipe"""
+        if file_path.lower().endswith('.wav') and self.load_from_wav(file_path):
+            return True
+
+        # ffmpeg decodes, resamples and maps channels straight into float32 on stdout
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-v', 'quiet', '-i', file_path, '-f', 'f32le',
+                 '-ar', str(self.sample_rate), '-ac', str(self.channels), 'pipe:1'],
+                capture_output=True,
+                check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(f"Error decoding audio file with ffmpeg: {e}")
+            return False
+
+        self._store_loaded(result.stdout, len(result.stdout) // (4 * self.channels), file_path)
+        return True
+
+    def _read_wav_samples(self, file_path):
+        """Read a WAV file as float32 samples
+
+        PCM 16-bit and the 32-bit files written by save_to_wav go through the wave module;
+        anything it cannot decode (24-bit, IEEE float, extensible headers) is read with
+        soundfile when available.
+
+        Returns:
+            tuple: (interleaved float32 samples, channels, sample rate), or None if unsupported
+        """
         try:
             with wave.open(file_path, 'r') as wf:
                 channels = wf.getnchannels()
                 sample_width = wf.getsampwidth()
                 sample_rate = wf.getframerate()
-                frames = wf.readframes(wf.getnframes())
 
                 # Convert to float32
                 if sample_width == 2:  # 16-bit audio
-                    data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+                    # Convert and scale in a single pass straight into the float32 result
+                    pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+                    data = np.empty(pcm.size, dtype=np.float32)
+                    np.multiply(pcm, np.float32(1.0 / 32768.0), out=data, casting='unsafe')
+                    return data, channels, sample_rate
                 elif sample_width == 4:  # 32-bit audio
-                    data = np.frombuffer(frames, dtype=np.float32)
-                else:
-                    logger.error(f"Unsupported sample width: {sample_width}")
-                    return False
-
-                # Resample if needed
-                if sample_rate != self.sample_rate:
-                    # Simple resampling - for production use scipy.signal.resample
-                    ratio = self.sample_rate / sample_rate
-                    data = np.interp(
-                        np.arange(0, len(data) * ratio, ratio),
-                        np.arange(0, len(data)),
-                        data
-                    )
-
-                # Convert to stereo if needed
-                if channels == 1 and self.channels == 2:
-                    data = np.repeat(data, 2)
-
-                # Clear existing data and store loaded data
-                self.input_buffer.clear()
+                    return np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.float32), channels, sample_rate
+        except wave.Error:
+            sample_width = None
 
-                # Split data into buffer-sized chunks
-                chunk_size = self.buffer_size * self.channels
-                chunks = [data[i:i+chunk_size] for i in range(0, len(data), chunk_size)]
+        if soundfile is None:
+            logger.error(f"Unsupported WAV format (sample width: {sample_width})")
+            return None
 
-                # Add chunks to input buffer
-                for chunk in chunks:
-                    self.input_buffer.append(chunk)
+        # libsndfile decodes straight to float32 frames
+        data, sample_rate = soundfile.read(file_path, dtype='float32', always_2d=True)
+        return data.ravel(), data.shape[1], sample_rate
 
-                logger.info(f"Audio loaded from {file_path}")
-                return True
+    def load_from_wav(self, file_path):
+        """Load audio from WAV file"""
+        try:
+            samples = self._read_wav_samples(file_path)
+            if samples is None:
+                return False
+            data, channels, sample_rate = samples
+
+            # Resample if needed, with a polyphase anti-aliasing filter applied per channel
+            if sample_rate != self.sample_rate:
+                ratio = Fraction(self.sample_rate, sample_rate).limit_denominator(1000)
+                data = resample_poly(
+                    data.reshape(-1, channels),
+                    ratio.numerator,
+                    ratio.denominator,
+                    axis=0
+                ).astype(np.float32).ravel()
+
+            # Upmix mono to every output channel with one broadcast store into the interleaved result
+            if channels == 1 and self.channels > 1:
+                upmixed = np.empty((data.size, self.channels), dtype=np.float32)
+                upmixed[:] = data[:, np.newaxis]
+                data = upmixed.ravel()
+
+            # Clear existing data and store loaded data
+            self._store_loaded(np.ascontiguousarray(data, dtype=np.float32), data.size // self.channels, file_path)
+            return True
 
         except Exception as e:
             logger.error(f"Error loading WAV file: {e}")
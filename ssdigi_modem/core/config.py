@@ -2,15 +2,26 @@
 Configuration management for SSDigi Modem
 """
 import os
+import copy
 import json
 import logging
+import tempfile
+import threading
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class Config:
     """Configuration manager for SSDigi Modem application"""
 
+    __slots__ = ('config_dir', 'config_file', 'data', '_file_stamp', '_file_revision', '_save_timer', '_save_lock',
+                 '_write_lock', '_written_revision', '_revision')
+
     DEFAULT_CONFIG = {
         "audio": {
             "input_device": None,  # Default audio input device
@@ -18,6 +29,7 @@ class Config:
             "sample_rate": 48000,
             "channels": 2,
             "buffer_size": 1024,
+            "low_latency": False,  # Use a small bandwidth-derived block size instead of buffer_size
         },
         "modem": {
             "mode": "ardop",
@@ -52,7 +64,14 @@ class Config:
         """Initialize configuration with default values"""
         self.config_dir = Path.home() / ".ssdigi_modem"
         self.config_file = self.config_dir / "config.json"
-        self.data = self.DEFAULT_CONFIG.copy()
+        self.data = copy.deepcopy(self.DEFAULT_CONFIG)  # Nested sections must not alias the class defaults
+        self._file_stamp = None  # (path, mtime_ns, size) of the file self.data last matched
+        self._file_revision = None  # revision of self.data at that point
+        self._save_timer = None  # Pending save_async write
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Serializes writes of the config file
+        self._written_revision = -1  # Newest revision written to the config file
+        self._revision = 0  # Bumped on every change to self.data (see revision)
 
     def load_default(self):
         """Load default configuration or existing configuration file if available"""
@@ -68,21 +87,82 @@ class Config:
             self._save_current()
 
     def load_from_file(self, file_path):
-        """Load configuration from specified JSON file"""
-        with open(file_path, 'r') as f:
-            loaded_config = json.load(f)
+        """Load configuration from specified JSON file
+
+        The file is not re-parsed if neither it nor the in-memory values changed since
+        it was last loaded or saved.
+        """
+        stamp = self._stamp(file_path)
+        if stamp == self._file_stamp and self._revision == self._file_revision:
+            return
+
+        with open(file_path, 'rb') as f:
+            loaded_config = self._loads(f.read())
             # Update configuration, preserving default values for missing keys
             self._recursive_update(self.data, loaded_config)
+        self._file_stamp = stamp
+        self._revision += 1
+        self._file_revision = self._revision
+
+    @property
+    def revision(self):
+        """Counter that changes whenever a value is set or loaded
+
+        Lets views skip re-reading the configuration if nothing changed since they last did.
+        """
+        return self._revision
 
     def save(self):
         """Save current configuration to the default location"""
+        self._cancel_pending_save()
         self._save_current()
 
+    def snapshot(self):
+        """Return a (values, revision) copy of the configuration for save_snapshot
+
+        Take it on the thread that changes the values; the copy can then be written
+        from any thread.
+        """
+        return copy.deepcopy(self.data), self._revision
+
+    def save_snapshot(self, snapshot):
+        """Save a snapshot taken with snapshot() to the default location"""
+        self._save_current(*snapshot)
+
+    def save_async(self, debounce=1.0):
+        """Schedule a save to the default location, coalescing calls within debounce seconds
+
+        The values are snapshotted on the calling thread, so later set/update calls
+        cannot change the dicts while the timer thread serializes them. The timer
+        thread is non-daemon, so a pending save still completes at interpreter exit.
+        """
+        snapshot = self.snapshot()
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(debounce, self._run_pending_save, args=snapshot)
+            self._save_timer.start()
+
+    def _cancel_pending_save(self):
+        """Cancel a save scheduled by save_async"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+    def _run_pending_save(self, data, revision):
+        """Perform a save scheduled by save_async from its snapshot"""
+        with self._save_lock:
+            self._save_timer = None
+        try:
+            self._save_current(data, revision)
+        except Exception as e:
+            logger.error(f"Failed to save configuration: {e}")
+
     def save_as(self, file_path):
         """Save current configuration to a specified file"""
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as f:
-            json.dump(self.data, f, indent=4)
+        self._write_atomic(file_path)
 
     def get(self, section, key=None, default=None):
         """Get configuration value(s) with optional default value
@@ -104,12 +184,72 @@ class Config:
         if section not in self.data:
             self.data[section] = {}
         self.data[section][key] = value
+        self._revision += 1
 
-    def _save_current(self):
-        """Save current configuration to the default location"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(self.data, f, indent=4)
+    def update(self, values):
+        """Set several values at once
+
+        Args:
+            values: Mapping of section name to a dict of key/value pairs
+        """
+        for section, items in values.items():
+            self.data.setdefault(section, {}).update(items)
+        self._revision += 1
+
+    def _save_current(self, data=None, revision=None):
+        """Save current configuration, or a snapshot of it, to the default location
+
+        Writes are serialized, and a snapshot older than the last one written is
+        dropped so a late timer save can never replace a newer file.
+        """
+        with self._write_lock:
+            if data is None:
+                data, revision = self.data, self._revision
+            if revision < self._written_revision:
+                logger.debug(f"Skipping stale config save (revision {revision} < {self._written_revision})")
+                return
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.config_file, data)
+            self._file_stamp = self._stamp(self.config_file)
+            self._file_revision = revision
+            self._written_revision = revision
+
+    def _write_atomic(self, file_path, data=None):
+        """Write configuration (or the given snapshot) to a temp file and rename it over file_path
+
+        A crash mid-write leaves the previous file intact instead of a truncated one.
+        """
+        if data is None:
+            data = self.data
+        file_path = Path(file_path)
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._dumps(data))
+            os.replace(tmp_path, file_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _stamp(file_path):
+        """Identify a file's current contents by path, modification time and size"""
+        stat = os.stat(file_path)
+        return (str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _loads(raw):
+        """Parse JSON bytes"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    @staticmethod
+    def _dumps(data):
+        """Serialize to indented JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode('utf-8')
 
     def _recursive_update(self, d, u):
         """Recursively update nested dictionaries"""
@@ -144,6 +284,7 @@ class Config:
         # Only set if force=True or if we're setting for the first time
         if force or not current:
             self.data["user"]["callsign"] = callsign
+            self._revision += 1
             return True
 
         return False
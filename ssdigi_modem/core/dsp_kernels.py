@@ -0,0 +1,28 @@
+"""
+DSP kernels for SSDigi Modem audio processing
+"""
+import numpy as np
+
+try:
+    import numba  # Optional: compiles the per-sample kernel to native code
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit('void(float32[:], float32[:], float32)', parallel=True, nogil=True, cache=True, fastmath=True)
+    def prepare_tx(src, dst, gain):
+        """Scale mono src by gain and write it to every channel of interleaved dst in one pass"""
+        if src.size == 0:
+            return
+        channels = dst.size // src.size
+        for i in numba.prange(src.size):
+            v = src[i] * gain
+            for ch in range(channels):
+                dst[i * channels + ch] = v
+else:
+    def prepare_tx(src, dst, gain):
+        """Scale mono src by gain and write it to every channel of interleaved dst in one pass"""
+        if src.size == 0:
+            return
+        np.multiply(src[:, np.newaxis], np.float32(gain), out=dst.reshape(src.size, -1))
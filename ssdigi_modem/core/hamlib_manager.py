@@ -5,14 +5,96 @@ import logging
 import socket
 import threading
 import time
-import re
 import subprocess
-import os
 import sys
+import shutil
+import functools
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# rigctld reply labels; the default protocol answers with bare values while
+# extended (+) mode prefixes a label, so _parse_value accepts both forms
+_FREQ_LABEL = b"Frequency:"
+_PTT_LABEL = b"PTT:"
+_LEVEL_LABEL = b"Level:"
+_RPRT_OK = b"RPRT 0"
+
+# Pre-encoded rigctld commands; only the value-bearing ones are formatted per call
+_CMD_GET_FREQ = b"f\n"
+_CMD_GET_PTT = b"t\n"
+_CMD_GET_STRENGTH = b"l STRENGTH\n"
+_CMD_GET_STATUS = _CMD_GET_FREQ + _CMD_GET_STRENGTH
+_CMD_SET_FREQ = b"F %d\n"
+_CMD_SET_PTT = (b"T 0\n", b"T 1\n")
+
+# Status poll cadence: back off while the rig is idle, tighten again once it changes
+_POLL_MIN_INTERVAL = 0.25
+_POLL_MAX_INTERVAL = 5.0
+
+# rigctld is always a local child process: bind it to loopback only and connect by address
+_RIGCTLD_HOST = "127.0.0.1"
+_RIGCTLD_PORT = 4532
+
+# Rig models offered for selection, as (hamlib model id, name)
+_RIG_MODELS = (
+    (1, "Dummy"),
+    (2, "NET rigctl"),
+    (120, "Yaesu FT-817"),
+    (122, "Yaesu FT-857"),
+    (103, "Yaesu FT-100"),
+    (176, "Yaesu FT-991"),
+    (220, "Elecraft K3"),
+    (351, "Icom IC-7300"),
+    (2028, "Kenwood TS-2000"),
+    (2035, "Kenwood TS-480"),
+    (2045, "Kenwood TS-590S"),
+)
+
+
+def _parse_value(response, label):
+    """Parse the integer in a one-line rigctld reply, with or without its label
+
+    Returns:
+        int: The value, or None if the reply holds no integer (e.g. an RPRT error)
+    """
+    _, sep, tail = response.partition(label)
+    fields = (tail if sep else response).split(None, 1)
+    if not fields:
+        return None
+    try:
+        return int(fields[0])
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_rigctld_path():
+    """Find the rigctld binary, once per process
+
+    Returns:
+        str: Path to rigctld, or None if it is not bundled, installed or on PATH
+    """
+    base_dir = Path(__file__).resolve().parents[2]
+
+    # Check for embedded binary first, then common Windows installation paths
+    if sys.platform == 'win32':
+        candidates = [
+            base_dir / "bin" / "hamlib" / "rigctld.exe",
+            Path(r"C:\Program Files\hamlib\bin\rigctld.exe"),
+            Path(r"C:\Program Files (x86)\hamlib\bin\rigctld.exe"),
+        ]
+    else:
+        candidates = [base_dir / "bin" / "hamlib" / "rigctld"]
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return str(candidate)
+
+    # Fall back to searching PATH
+    return shutil.which("rigctld")
+
+
 class HamlibManager:
     """HAMLIB rig control for SSDigi Modem"""
 
@@ -23,6 +105,11 @@ class HamlibManager:
         self.rigctld_process = None
         self.socket = None
 
+        # Reply buffering: recv_into a reusable buffer, carry partial lines between reads
+        self._recv_buf = bytearray(4096)
+        self._recv_view = memoryview(self._recv_buf)
+        self._pending = bytearray()
+
         # Communication settings
         self.rig_model = config.get('hamlib', 'rig_model')
         self.port = config.get('hamlib', 'port')
@@ -39,49 +126,21 @@ class HamlibManager:
             'signal_strength': 0,
         }
 
+        # Called with a copy of the status whenever it changes (see set_status_callback)
+        self.status_callback = None
+        self._published_status = None
+
         # Lock for thread safety
         self.lock = threading.Lock()
 
-        # Communication thread
+        # Communication thread, woken early via _poll_event when a fresh read is needed
         self.comm_thread = None
         self.comm_thread_running = False
+        self._poll_event = threading.Event()
+        self._poll_interval = 1.0
 
-        # Find hamlib binary path
-        self.rigctld_path = self._get_rigctld_path()
-
-    def _get_rigctld_path(self):
-        """Find rigctld binary"""
-        # In a real implementation, this would point to embedded binaries
-        # For now, we'll assume rigctld is in PATH or use a default location
-
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-        if sys.platform == 'win32':
-            # Check for embedded binary first
-            embedded_path = os.path.join(base_dir, "bin", "hamlib", "rigctld.exe")
-            if os.path.exists(embedded_path):
-                return embedded_path
-
-            # Check common Windows installation paths
-            potential_paths = [
-                r"C:\Program Files\hamlib\bin\rigctld.exe",
-                r"C:\Program Files (x86)\hamlib\bin\rigctld.exe"
-            ]
-
-            for path in potential_paths:
-                if os.path.exists(path):
-                    return path
-
-            # Fall back to assuming it's in PATH
-            return "rigctld.exe"
-        else:
-            # Check for embedded binary first
-            embedded_path = os.path.join(base_dir, "bin", "hamlib", "rigctld")
-            if os.path.exists(embedded_path):
-                return embedded_path
-
-            # Fall back to assuming it's in PATH
-            return "rigctld"
+        # Find hamlib binary path (resolved once per process)
+        self.rigctld_path = _resolve_rigctld_path()
 
     def connect(self):
         """Connect to rig control"""
@@ -105,18 +164,20 @@ class HamlibManager:
                 self._stop_rigctld()
                 return False
 
-            # Start communication thread
-            self.comm_thread_running = True
-            self.comm_thread = threading.Thread(target=self._communication_loop)
-            self.comm_thread.daemon = True
-            self.comm_thread.start()
-
             # Enable HAMLIB in config
             self.config.set('hamlib', 'enabled', True)
-            self.config.save()
+            self.config.save_async()
 
             self.connected = True
             self.status['connected'] = True
+
+            # Start communication thread (after connected is set, which its loop checks)
+            self._poll_interval = 1.0
+            self.comm_thread_running = True
+            self.comm_thread = threading.Thread(target=self._communication_loop)
+            self.comm_thread.daemon = True
+            self.comm_thread.start()
+            self._publish_status()
             logger.info("HAMLIB connected")
             return True
 
@@ -131,8 +192,9 @@ class HamlibManager:
             return True
 
         try:
-            # Stop communication thread
+            # Stop communication thread, waking it from its poll wait
             self.comm_thread_running = False
+            self._poll_event.set()
             if self.comm_thread:
                 self.comm_thread.join(timeout=1.0)
 
@@ -144,10 +206,11 @@ class HamlibManager:
 
             # Update config
             self.config.set('hamlib', 'enabled', False)
-            self.config.save()
+            self.config.save_async()
 
             self.connected = False
             self.status['connected'] = False
+            self._publish_status()
             logger.info("HAMLIB disconnected")
             return True
 
@@ -163,6 +226,21 @@ class HamlibManager:
         """Get current rig status"""
         return self.status
 
+    def set_status_callback(self, callback):
+        """Set a callable to receive a status copy whenever it changes (None to clear)
+
+        The callback may run on the communication thread.
+        """
+        self.status_callback = callback
+
+    def _publish_status(self):
+        """Push the status to the registered callback if it changed since the last push"""
+        callback = self.status_callback
+        if callback is None or self.status == self._published_status:
+            return
+        self._published_status = dict(self.status)
+        callback(dict(self.status))
+
     def set_frequency(self, freq):
         """Set rig frequency"""
         if not self.connected:
@@ -175,14 +253,14 @@ class HamlibManager:
                     return False
 
                 # Send frequency command
-                cmd = f"F {freq}\n"
-                self.socket.sendall(cmd.encode('utf-8'))
+                self.socket.sendall(_CMD_SET_FREQ % freq)
 
                 # Read response
                 response = self._read_response()
-                if response and "RPRT 0" in response:
+                if response and _RPRT_OK in response:
                     self.status['frequency'] = freq
                     logger.info(f"Set frequency to {freq} Hz")
+                    self._poll_event.set()
                     return True
                 else:
                     logger.error(f"Failed to set frequency: {response}")
@@ -204,15 +282,13 @@ class HamlibManager:
                     return 0
 
                 # Send frequency query command
-                cmd = "f\n"
-                self.socket.sendall(cmd.encode('utf-8'))
+                self.socket.sendall(_CMD_GET_FREQ)
 
                 # Read response
                 response = self._read_response()
                 if response:
-                    match = re.search(r'Frequency: (\d+)', response)
-                    if match:
-                        freq = int(match.group(1))
+                    freq = _parse_value(response, _FREQ_LABEL)
+                    if freq is not None:
                         self.status['frequency'] = freq
                         return freq
 
@@ -235,14 +311,14 @@ class HamlibManager:
                     return False
 
                 # Send PTT command
-                cmd = f"T {1 if enabled else 0}\n"
-                self.socket.sendall(cmd.encode('utf-8'))
+                self.socket.sendall(_CMD_SET_PTT[bool(enabled)])
 
                 # Read response
                 response = self._read_response()
-                if response and "RPRT 0" in response:
+                if response and _RPRT_OK in response:
                     self.status['ptt_status'] = 'ON' if enabled else 'OFF'
                     logger.info(f"PTT set to {'ON' if enabled else 'OFF'}")
+                    self._poll_event.set()
                     return True
                 else:
                     logger.error(f"Failed to set PTT: {response}")
@@ -264,15 +340,14 @@ class HamlibManager:
                     return False
 
                 # Send PTT query command
-                cmd = "t\n"
-                self.socket.sendall(cmd.encode('utf-8'))
+                self.socket.sendall(_CMD_GET_PTT)
 
                 # Read response
                 response = self._read_response()
                 if response:
-                    match = re.search(r'PTT: (\d+)', response)
-                    if match:
-                        ptt_state = int(match.group(1)) == 1
+                    value = _parse_value(response, _PTT_LABEL)
+                    if value is not None:
+                        ptt_state = value == 1
                         self.status['ptt_status'] = 'ON' if ptt_state else 'OFF'
                         return ptt_state
 
@@ -294,15 +369,13 @@ class HamlibManager:
                     return -54
 
                 # Send signal strength query command
-                cmd = "l STRENGTH\n"
-                self.socket.sendall(cmd.encode('utf-8'))
+                self.socket.sendall(_CMD_GET_STRENGTH)
 
                 # Read response
                 response = self._read_response()
                 if response:
-                    match = re.search(r'Level: ([-\d]+)', response)
-                    if match:
-                        level = int(match.group(1))
+                    level = _parse_value(response, _LEVEL_LABEL)
+                    if level is not None:
                         self.status['signal_strength'] = level
                         return level
 
@@ -313,41 +386,16 @@ class HamlibManager:
             return -54
 
     def get_available_rig_models(self):
-        """Get list of available rig models from hamlib"""
-        models = [
-            (1, "Dummy"),
-            (2, "NET rigctl"),
-            (120, "Yaesu FT-817"),
-            (122, "Yaesu FT-857"),
-            (103, "Yaesu FT-100"),
-            (176, "Yaesu FT-991"),
-            (220, "Elecraft K3"),
-            (351, "Icom IC-7300"),
-            (2028, "Kenwood TS-2000"),
-            (2035, "Kenwood TS-480"),
-            (2045, "Kenwood TS-590S"),
-        ]
-
-        return models
+        """Get list of available rig models from hamlib as (model id, name) pairs"""
+        return _RIG_MODELS
 
     def _start_rigctld(self):
         """Start the rigctld process"""
         try:
-            # Check if path exists
-            if not os.path.exists(self.rigctld_path):
-                logger.error(f"rigctld not found at {self.rigctld_path}")
-                # Try to find in PATH
-                try:
-                    import shutil
-                    path = shutil.which("rigctld")
-                    if path:
-                        self.rigctld_path = path
-                    else:
-                        logger.error("rigctld not found in PATH")
-                        return False
-                except:
-                    logger.error("Could not find rigctld")
-                    return False
+            # The resolver already checked the bundled and installed locations and PATH
+            if not self.rigctld_path:
+                logger.error("rigctld not found in bundled, installed or PATH locations")
+                return False
 
             # Prepare rigctld arguments
             args = [
@@ -355,22 +403,22 @@ class HamlibManager:
                 "-m", str(self.rig_model),  # Rig model
                 "-r", self.port,            # Serial port
                 "-s", str(self.baud_rate),  # Baud rate
-                "-t", "4532"                # TCP port for control
+                "-T", _RIGCTLD_HOST,        # Listen on loopback only
+                "-t", str(_RIGCTLD_PORT)    # TCP port for control
             ]
 
             # For dummy rig, no need for serial port
             if self.rig_model == 1:
-                args = [self.rigctld_path, "-m", "1", "-t", "4532"]
+                args = [self.rigctld_path, "-m", "1", "-T", _RIGCTLD_HOST, "-t", str(_RIGCTLD_PORT)]
 
-            # Start rigctld process
+            # Start rigctld process; stdout is never read, and stderr is only
+            # collected for diagnostics once the process has exited
             logger.info(f"Starting rigctld: {' '.join(args)}")
             self.rigctld_process = subprocess.Popen(
                 args,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
 
             # Wait for startup
@@ -378,8 +426,7 @@ class HamlibManager:
 
             # Check if process is running
             if self.rigctld_process.poll() is not None:
-                stdout, stderr = self.rigctld_process.communicate()
-                logger.error(f"rigctld failed to start: {stderr}")
+                logger.error(f"rigctld failed to start: {self._rigctld_stderr()}")
                 return False
 
             logger.info("rigctld process started")
@@ -389,6 +436,14 @@ class HamlibManager:
             logger.exception(f"Error starting rigctld: {e}")
             return False
 
+    def _rigctld_stderr(self):
+        """Collect the stderr output of an exited rigctld process"""
+        try:
+            _, stderr = self.rigctld_process.communicate(timeout=1)
+            return stderr.decode(errors='replace').strip() if stderr else ""
+        except subprocess.TimeoutExpired:
+            return ""
+
     def _stop_rigctld(self):
         """Stop the rigctld process"""
         try:
@@ -413,8 +468,18 @@ class HamlibManager:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5.0)
 
+            # Commands are a few bytes each: send them immediately instead of waiting on
+            # Nagle coalescing, and keep the long-lived control channel's buffers small
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+
             # Connect to rigctld
-            self.socket.connect(('localhost', 4532))
+            self.socket.connect((_RIGCTLD_HOST, _RIGCTLD_PORT))
+
+            # Read timeout for every reply; set once here so reads pay no setsockopt
+            self.socket.settimeout(2.0)
 
             logger.info("Connected to rigctld socket")
             return True
@@ -430,37 +495,69 @@ class HamlibManager:
             if self.socket:
                 self.socket.close()
                 self.socket = None
+                self._pending.clear()
                 logger.info("Disconnected from rigctld socket")
         except Exception as e:
             logger.exception(f"Error disconnecting from rigctld socket: {e}")
 
+    def _read_line(self):
+        """Read one newline-terminated reply line, keeping any surplus bytes for the next call
+
+        Returns:
+            bytes: The stripped line (or what remained if rigctld closed the socket)
+        """
+        while True:
+            end = self._pending.find(b'\n')
+            if end >= 0:
+                line = bytes(self._pending[:end]).strip()
+                del self._pending[:end + 1]
+                return line
+
+            # Receive into the persistent buffer instead of allocating a chunk per recv
+            received = self.socket.recv_into(self._recv_view)
+            if not received:
+                line = bytes(self._pending).strip()
+                self._pending.clear()
+                return line
+            self._pending += self._recv_view[:received]
+
     def _read_response(self):
         """Read response from rigctld socket"""
         try:
             if not self.socket:
                 return None
 
-            # Set timeout to avoid blocking forever
-            self.socket.settimeout(2.0)
+            # Read response as raw bytes; parsers match without decoding
+            return self._read_line()
 
-            # Read response
-            response = ""
-            while True:
-                chunk = self.socket.recv(4096).decode('utf-8')
-                if not chunk:
-                    break
+        except socket.timeout:
+            logger.warning("Socket timeout while reading response")
+            self._pending.clear()
+            return None
+        except Exception as e:
+            logger.exception(f"Error reading response: {e}")
+            return None
 
-                response += chunk
-                if '\n' in chunk:
-                    break
+    def _read_n_responses(self, count):
+        """Read count newline-terminated responses from rigctld socket
+
+        Returns:
+            list: The response lines, or None if fewer than count arrived
+        """
+        try:
+            if not self.socket:
+                return None
 
-            return response.strip()
+            # Read until every queued reply has arrived
+            lines = [self._read_line() for _ in range(count)]
+            return lines if all(lines) else None
 
         except socket.timeout:
-            logger.warning("Socket timeout while reading response")
+            logger.warning("Socket timeout while reading responses")
+            self._pending.clear()
             return None
         except Exception as e:
-            logger.exception(f"Error reading response: {e}")
+            logger.exception(f"Error reading responses: {e}")
             return None
 
     def _communication_loop(self):
@@ -469,32 +566,52 @@ class HamlibManager:
             while self.comm_thread_running and self.connected:
                 if self.rigctld_process and self.rigctld_process.poll() is not None:
                     # rigctld process has terminated unexpectedly
-                    stdout, stderr = self.rigctld_process.communicate()
-                    logger.error(f"rigctld process terminated: {stderr}")
+                    logger.error(f"rigctld process terminated: {self._rigctld_stderr()}")
                     self.connected = False
                     self.status['connected'] = False
+                    self._publish_status()
                     break
 
                 # Update rig status
+                previous = (self.status['frequency'], self.status['signal_strength'])
                 self._update_status()
+                self._publish_status()
 
-                # Sleep to reduce CPU usage
-                time.sleep(1.0)
+                # Poll quickly while the rig is changing, back off exponentially while idle
+                if (self.status['frequency'], self.status['signal_strength']) == previous:
+                    self._poll_interval = min(self._poll_interval * 2, _POLL_MAX_INTERVAL)
+                else:
+                    self._poll_interval = _POLL_MIN_INTERVAL
+
+                # Wait for the next poll, or until a caller asks for a fresh read
+                self._poll_event.wait(self._poll_interval)
+                self._poll_event.clear()
         except Exception as e:
             logger.exception(f"Error in communication loop: {e}")
             self.connected = False
             self.status['connected'] = False
+            self._publish_status()
 
     def _update_status(self):
-        """Update rig status"""
+        """Update rig status with a single batched rigctld round-trip"""
         try:
-            # Get current frequency
-            freq = self.get_frequency()
-            if freq > 0:
+            with self.lock:
+                if not self.socket:
+                    return
+
+                # Query frequency and signal strength in one write and read both replies
+                self.socket.sendall(_CMD_GET_STATUS)
+                responses = self._read_n_responses(2)
+
+            if not responses:
+                return
+
+            freq = _parse_value(responses[0], _FREQ_LABEL)
+            if freq is not None and freq > 0:
                 self.status['frequency'] = freq
 
-            # Get signal strength periodically
-            self.status['signal_strength'] = self.get_signal_strength()
+            level = _parse_value(responses[1], _LEVEL_LABEL)
+            self.status['signal_strength'] = level if level is not None else -54
 
         except Exception as e:
             logger.exception(f"Error updating status: {e}")
@@ -28,6 +28,9 @@ class ModemManager:
         self.connected = self.active_modem.connected
         self.status = self.active_modem.status
 
+        # FFT push callback, re-attached whenever the modem implementation is replaced
+        self._fft_callback = None
+
     def connect(self):
         """Connect to the modem - delegates to active modem implementation"""
         result = self.active_modem.connect()
@@ -74,6 +77,15 @@ class ModemManager:
         """Get current FFT data for spectrum display"""
         return self.active_modem.get_fft_data()
 
+    def fill_fft_data(self, out):
+        """Write current FFT data for spectrum display into out in place"""
+        return self.active_modem.fill_fft_data(out)
+
+    def set_fft_callback(self, callback):
+        """Have the modem push each new FFT frame to callback from its own thread"""
+        self._fft_callback = callback
+        self.active_modem.set_fft_callback(callback)
+
     def send_text(self, text):
         """Send text message"""
         return self.active_modem.send_text(text)
@@ -109,6 +121,7 @@ class ModemManager:
             # Create new modem instance
             self.mode = new_mode
             self.active_modem = ModemFactory.create_modem(self.mode, self.config, self.hamlib_manager)
+            self.active_modem.set_fft_callback(self._fft_callback)
 
             # Update local properties
             self.bandwidth = self.active_modem.bandwidth
@@ -19,6 +19,9 @@ from ssdigi_modem.core.modems.ardop_modem_commands import generate_host_commands
 
 logger = logging.getLogger(__name__)
 
+# ARQ bandwidths supported by ARDOP, in Hz
+ARDOP_BANDWIDTHS = (200, 500, 1000, 2000)
+
 class ArdopModem(BaseModem):
     """ARDOP modem implementation for SSDigi Modem"""
 
@@ -34,6 +37,9 @@ class ArdopModem(BaseModem):
         self.cmd_thread = None
         self.cmd_thread_running = False
 
+        # Noise source for the synthetic noise floor shown without live FFT data
+        self._rng = np.random.default_rng()
+
         # Default ports for ARDOP
         self.cmd_port = 8515
         self.data_port = 8516
@@ -129,42 +135,55 @@ class ArdopModem(BaseModem):
 
     def get_fft_data(self):
         """Get current FFT data for spectrum display"""
-        if not self.connected:
-            # When not connected, return a synthetic noise floor
-            noise_floor = -80 + np.random.normal(0, 1, self.fft_size // 2)
-            return noise_floor
-
-        # Get actual FFT data from ARDOP
-        if hasattr(self, 'fft_data') and self.fft_data is not None:
-            # Check if data contains any invalid values
-            if np.isnan(self.fft_data).any() or np.isinf(self.fft_data).any():
-                logger.warning("Invalid FFT data detected (NaN or Inf), using synthetic data")
-                return -80 + np.random.normal(0, 1, self.fft_size // 2)
-
-            # Check for extreme values that would cause rendering issues
-            min_value = np.min(self.fft_data)
-            max_value = np.max(self.fft_data)
-
-            # Log if values are out of expected range
-            if min_value < -120 or max_value > 0:
-                logger.debug(f"FFT data out of range: min={min_value}, max={max_value}, normalizing")
-
-            # Ensure the FFT data is within reasonable limits to prevent display issues
-            # Using a wider range to prevent all-red display
-            min_val = -120  # Lower minimum value to ensure good color spread
-            max_val = -20   # Maximum value in dB (strongest signal)
-
-            # Normalize and clamp values to ensure they're in a reasonable range
-            # This will give better color distribution in the waterfall
-            normalized_data = np.interp(self.fft_data, [min_value, max_value], [min_val, max_val])
-            clamped_data = np.clip(normalized_data, min_val, max_val)
-
-            # Return the normalized and clamped data
-            return clamped_data
+        fft_data = np.empty(self.fft_size // 2)
+        self.fill_fft_data(fft_data)
+        return fft_data
+
+    def fill_fft_data(self, out):
+        """Write current FFT data for spectrum display into out in place
+
+        Both the pull path and the frames pushed through _publish_fft go through
+        here, so the views see the same scaling either way.
+        """
+        if len(out) != self.fft_size // 2:
+            return False
+
+        fft_data = self.fft_data if self.connected else None
+        if fft_data is not None and not np.isfinite(fft_data).all():
+            logger.warning("Invalid FFT data detected (NaN or Inf), using synthetic data")
+            fft_data = None
+        if fft_data is None or len(fft_data) == 0:
+            # Synthetic noise floor, generated straight into out
+            self._rng.standard_normal(out=out, dtype=out.dtype)
+            out -= 80
+            return True
+
+        # Frames from a WAV file are rfft-sized (fft_size // 2 + 1 bins); resample
+        # to the display size the same way _parse_ardop_stdout does
+        if len(fft_data) != len(out):
+            fft_data = np.interp(
+                np.linspace(0, 1, len(out)),
+                np.linspace(0, 1, len(fft_data)),
+                fft_data
+            )
+
+        # Linear map of the data range onto -120..-20 dB for a good color spread;
+        # a flat frame maps to the top of the range, as np.interp would
+        min_value = np.min(fft_data)
+        max_value = np.max(fft_data)
+        if min_value < -120 or max_value > 0:
+            logger.debug(f"FFT data out of range: min={min_value}, max={max_value}, normalizing")
+        if max_value > min_value:
+            np.subtract(fft_data, min_value, out=out)
+            out *= 100.0 / (max_value - min_value)
+            out -= 120
         else:
-            # If no data is available yet, return a reasonable noise floor
-            noise_floor = -80 + np.random.normal(0, 1, self.fft_size // 2)
-            return noise_floor
+            out.fill(-20)
+        return True
+
+    def get_available_bandwidths(self):
+        """Get list of available bandwidths"""
+        return ARDOP_BANDWIDTHS
 
     def send_ping(self):
         """Send PING command to ARDOP - useful for testing and diagnostics
@@ -1024,6 +1043,8 @@ class ArdopModem(BaseModem):
                     # Keep a history of FFT data for waterfall
                     if len(self.signal_buffer) < 100:  # Limit buffer size
                         self.signal_buffer.append(fft_data.copy())
+                    # Push the display-ready frame to the UI
+                    self._publish_fft(self.get_fft_data())
             except Exception as e:
                 logger.exception(f"Error parsing FFT data: {e}")
 
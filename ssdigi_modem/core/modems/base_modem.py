@@ -53,6 +53,9 @@ class BaseModem:
         # Signal buffer for recording
         self.signal_buffer = []
 
+        # Called with each new FFT frame, from the modem's own thread
+        self.fft_callback = None
+
         # Initialize communication thread
         self.comm_thread = None
         self.comm_thread_running = False
@@ -93,10 +96,34 @@ class BaseModem:
         """Get list of available bandwidths - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement get_available_bandwidths()")
 
+    def set_fft_callback(self, callback):
+        """Set a callable to receive each new FFT frame as it is produced (None to clear)"""
+        self.fft_callback = callback
+
+    def _publish_fft(self, fft_data):
+        """Push an FFT frame to the registered callback, if any"""
+        callback = self.fft_callback
+        if callback is not None:
+            callback(fft_data)
+
     def get_fft_data(self):
         """Get current FFT data for spectrum display - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement get_fft_data()")
 
+    def fill_fft_data(self, out):
+        """Write current FFT data for spectrum display into out in place
+
+        Subclasses may override this to avoid the temporary array from get_fft_data.
+
+        Returns:
+            bool: True if out was filled, False if no data of matching size is available
+        """
+        data = self.get_fft_data()
+        if data is None or len(data) != len(out):
+            return False
+        out[...] = data
+        return True
+
     def send_text(self, text):
         """Send text message - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement send_text()")
@@ -0,0 +1,142 @@
+"""
+Lock-free ring buffer for SSDigi Modem audio paths
+"""
+import numpy as np
+
+
+def next_pow2(n):
+    """Return the smallest power of two that is >= n"""
+    return 1 << max(0, int(n) - 1).bit_length()
+
+
+class RingBuffer:
+    """Single-producer/single-consumer ring buffer of fixed-size elements
+
+    Mirrors the interface of PortAudio's pa_ringbuffer (as exposed by
+    rtmixer.RingBuffer), so the audio callback only ever copies bytes into
+    preallocated storage. One thread may write and one thread may read
+    concurrently without locking; the read and write indices are only ever
+    advanced by their owning side.
+    """
+
+    def __init__(self, elementsize, size):
+        """Initialize ring buffer
+
+        Args:
+            elementsize: Size of one element in bytes
+            size: Capacity in elements, must be a power of two
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Ring buffer size must be a power of two, got {size}")
+
+        self.elementsize = elementsize
+        self.size = size
+        self._mask = size - 1
+        self._data = np.zeros(size * elementsize, dtype=np.uint8)
+        self._view = memoryview(self._data)  # Reused by write/readinto to avoid per-call ndarrays
+        self._read_index = 0
+        self._write_index = 0
+
+    @property
+    def read_available(self):
+        """Number of elements available for reading"""
+        return (self._write_index - self._read_index) & (2 * self.size - 1)
+
+    @property
+    def write_available(self):
+        """Number of elements available for writing"""
+        return self.size - self.read_available
+
+    def flush(self):
+        """Discard all data (only safe while neither side is active)"""
+        self._read_index = 0
+        self._write_index = 0
+
+    def get_write_buffers(self, size):
+        """Get up to two writable regions for size elements
+
+        Returns:
+            tuple: (elements, first_region, second_region) as uint8 views
+        """
+        size = min(size, self.write_available)
+        return (size,) + self._regions(self._write_index, size)
+
+    def advance_write_index(self, size):
+        """Commit size elements previously filled via get_write_buffers"""
+        self._write_index = (self._write_index + size) & (2 * self.size - 1)
+        return size
+
+    def get_read_buffers(self, size):
+        """Get up to two readable regions for size elements without consuming them
+
+        Returns:
+            tuple: (elements, first_region, second_region) as uint8 views
+        """
+        size = min(size, self.read_available)
+        return (size,) + self._regions(self._read_index, size)
+
+    def advance_read_index(self, size):
+        """Consume size elements previously inspected via get_read_buffers"""
+        self._read_index = (self._read_index + size) & (2 * self.size - 1)
+        return size
+
+    def write(self, data, size=-1):
+        """Write data into the ring buffer
+
+        Args:
+            data: Any contiguous buffer (bytes, ndarray, ...)
+            size: Number of elements to write, or -1 for all of data
+
+        Returns:
+            int: Number of elements actually written
+        """
+        data = memoryview(data).cast('B')
+        if size < 0:
+            size = len(data) // self.elementsize
+        size = min(size, self.write_available)
+        self._copy_in(self._write_index, data, size)
+        return self.advance_write_index(size)
+
+    def readinto(self, data):
+        """Read as many elements as fit into a writable buffer
+
+        Returns:
+            int: Number of elements actually read
+        """
+        data = memoryview(data).cast('B')
+        size = min(len(data) // self.elementsize, self.read_available)
+        self._copy_out(self._read_index, data, size)
+        return self.advance_read_index(size)
+
+    def read(self, size=-1):
+        """Read up to size elements (all available if -1) into a new bytes object"""
+        if size < 0:
+            size = self.read_available
+        size, first, second = self.get_read_buffers(size)
+        data = first.tobytes() + second.tobytes()
+        self.advance_read_index(size)
+        return data
+
+    def _copy_in(self, index, data, size):
+        """Copy size elements from a byte memoryview into storage starting at index"""
+        start = (index & self._mask) * self.elementsize
+        nbytes = size * self.elementsize
+        split = min(nbytes, len(self._view) - start)
+        self._view[start:start + split] = data[:split]
+        self._view[:nbytes - split] = data[split:nbytes]
+
+    def _copy_out(self, index, data, size):
+        """Copy size elements from storage starting at index into a byte memoryview"""
+        start = (index & self._mask) * self.elementsize
+        nbytes = size * self.elementsize
+        split = min(nbytes, len(self._view) - start)
+        data[:split] = self._view[start:start + split]
+        data[split:nbytes] = self._view[:nbytes - split]
+
+    def _regions(self, index, size):
+        """Split size elements starting at index into at most two contiguous regions"""
+        start = index & self._mask
+        first = min(size, self.size - start)
+        es = self.elementsize
+        return (self._data[start * es:(start + first) * es],
+                self._data[:(size - first) * es])
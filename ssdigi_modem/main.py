@@ -8,6 +8,7 @@ import argparse
 import logging
 from pathlib import Path
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
 from ssdigi_modem.ui.main_window import MainWindow
@@ -34,6 +35,8 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description="SSDigi Modem - Digital modem for amateur radio")
     parser.add_argument("--config", help="Path to config file")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--profile", nargs="?", const=str(Path.home() / ".ssdigi_modem" / "settings.prof"),
+                        metavar="PATH", help="Profile the settings dialog and write cProfile stats to PATH")
 
     return parser.parse_args()
 
@@ -49,6 +52,10 @@ def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.profile:
+        from ssdigi_modem.ui.settings_dialog import PROFILE_ENV
+        os.environ[PROFILE_ENV] = args.profile
+
     logger.info("Starting SSDigi Modem")
 
     # Load configuration
@@ -58,7 +65,8 @@ def main():
     else:
         config.load_default()
 
-    # Start Qt application
+    # Start Qt application (application attributes must be set before it is created)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
     app.setApplicationName("SSDigi Modem")
     app.setOrganizationName("XenoLabs Solutions")    # Create and show main window
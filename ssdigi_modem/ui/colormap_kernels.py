@@ -0,0 +1,44 @@
+"""
+Colormap kernels for SSDigi Modem waterfall rendering
+"""
+import numpy as np
+
+try:
+    import numba  # Optional: fuses the per-pixel row mapping into one native loop
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit('void(float32[:], intp[:, :], float64[:, :], float64, float64, uint32[:], uint32, uint32[:])',
+                nogil=True, cache=True, fastmath=True)
+    def map_row(fft_data, bin_idx, bin_weight, min_value, max_value, lut, bg, out):
+        """Interpolate, normalize and colour one waterfall row of FFT dB values into out"""
+        bins = fft_data.size
+        value_range = max_value - min_value
+        for px in range(out.size):
+            total_value = 0.0
+            total_weight = 0.0
+            for slot in range(bin_idx.shape[1]):
+                idx = bin_idx[px, slot]
+                if idx < bins:
+                    weight = bin_weight[px, slot]
+                    total_value += min(max(fft_data[idx], min_value), max_value) * weight
+                    total_weight += weight
+            if total_weight > 0:
+                normalized = (total_value / total_weight - min_value) / value_range
+                out[px] = lut[int(min(max(normalized, 0.0), 0.98) * 255)]
+            else:
+                out[px] = bg
+else:
+    def map_row(fft_data, bin_idx, bin_weight, min_value, max_value, lut, bg, out):
+        """Interpolate, normalize and colour one waterfall row of FFT dB values into out"""
+        bins = fft_data.size
+        values = np.clip(fft_data, min_value, max_value)[np.minimum(bin_idx, bins - 1)]
+        weights = np.where(bin_idx < bins, bin_weight, 0.0)
+        total_weight = weights.sum(axis=1)
+        has_bins = total_weight > 0
+        value = (values * weights).sum(axis=1) / np.where(has_bins, total_weight, 1.0)
+        normalized = np.clip((value - min_value) / (max_value - min_value), 0.0, 0.98)
+        lut.take((normalized * 255).astype(np.uint8), out=out)
+        out[~has_bins] = bg
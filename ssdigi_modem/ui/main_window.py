@@ -2,8 +2,11 @@
 Main window for SSDigi Modem application
 """
 import os
+import time
 import logging
 import datetime
+from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QLabel, QPushButton, QComboBox, QTabWidget, QTableWidget,
@@ -11,7 +14,8 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QDialog, QLineEdit, QFormLayout, QDialogButtonBox, QCheckBox,
                             QGroupBox, QTextEdit, QListWidget, QGridLayout)
 from PyQt5.QtGui import QIcon, QColor, QMovie
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QSize
+from PyQt5.QtCore import (Qt, QTimer, pyqtSlot, pyqtSignal, QSize, QObject, QRunnable, QThreadPool, QEvent,
+                          QSignalBlocker)
 from ssdigi_modem.ui.spectrum_view import SpectrumView
 from ssdigi_modem.ui.waterfall_view import WaterfallView
 from ssdigi_modem.ui.settings_dialog import SettingsDialog
@@ -22,9 +26,97 @@ from ssdigi_modem.utils.ui_helpers import get_app_icon
 
 logger = logging.getLogger(__name__)
 
+# Monitoring label styles, built once rather than on every status update
+_VALUE_STYLE = """
+    QLabel {
+        color: %s;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+        padding: 2px;
+        border: 1px solid #404040;
+        background: #1a1a1a;
+        border-radius: 2px;
+    }
+"""
+_STYLE_NORMAL = _VALUE_STYLE % "#2196F3"
+_STYLE_ALERT = _VALUE_STYLE % "#ff0000"
+_STYLE_ACTIVE = _VALUE_STYLE % "#00ff00"
+_STYLE_RX_ON = "QLabel { color: #00ff00; font-weight: bold; }"
+_STYLE_TX_ON = "QLabel { color: #ff0000; font-weight: bold; }"
+_STYLE_INDICATOR_OFF = "QLabel { color: gray; }"
+
+@dataclass
+class StatusLabels:
+    """Optional status labels, accessed as attributes rather than by string key"""
+    connection: Optional[QLabel] = None
+    snr: Optional[QLabel] = None
+    signal: Optional[QLabel] = None
+    mode: Optional[QLabel] = None
+    bandwidth: Optional[QLabel] = None
+
+
+class DeviceEnumSignals(QObject):
+    """Signals emitted by DeviceEnumWorker"""
+    finished = pyqtSignal(list, list)
+
+
+class DeviceEnumWorker(QRunnable):
+    """Enumerate audio devices off the GUI thread, warming the audio manager's cache"""
+
+    def __init__(self, audio_manager):
+        """Initialize worker"""
+        super().__init__()
+        self.audio_manager = audio_manager
+        self.signals = DeviceEnumSignals()
+
+    def run(self):
+        """Query input and output devices and emit the results"""
+        try:
+            inputs = self.audio_manager.get_input_devices()
+            outputs = self.audio_manager.get_output_devices()
+        except Exception as e:
+            logger.error(f"Error enumerating audio devices: {e}")
+            inputs, outputs = [], []
+        self.signals.finished.emit(inputs, outputs)
+
+
+class WavIOSignals(QObject):
+    """Signals emitted by WavIOWorker"""
+    finished = pyqtSignal(bool, str)
+
+
+class WavIOWorker(QRunnable):
+    """Run a WAV save or load off the GUI thread"""
+
+    def __init__(self, func, file_path):
+        """Initialize worker"""
+        super().__init__()
+        self.func = func
+        self.file_path = file_path
+        self.signals = WavIOSignals()
+
+    def run(self):
+        """Call func(file_path) and emit whether it succeeded, with any error message"""
+        try:
+            ok, error = bool(self.func(self.file_path)), ""
+        except Exception as e:
+            logger.exception("Error during WAV file I/O")
+            ok, error = False, str(e)
+        self.signals.finished.emit(ok, error)
+
+
 class MainWindow(QMainWindow):
     """Main window for SSDigi Modem application"""
 
+    # Emitted once per spectrum frame; both visualizations consume it
+    fftReady = pyqtSignal(object)
+
+    # Raw FFT frames pushed from the modem's thread, delivered queued to the GUI thread
+    modemFftReceived = pyqtSignal(object)
+
+    # Rig status pushed from the HAMLIB communication thread whenever it changes
+    hamlibStatusChanged = pyqtSignal(dict)
+
     def __init__(self, config):
         """Initialize main window"""
         super().__init__()
@@ -36,8 +128,32 @@ class MainWindow(QMainWindow):
         self.modem_manager = ModemManager(self.config)
         self.hamlib_manager = HamlibManager(self.config)
 
-        # Initialize status labels dictionary
-        self.status_labels = {}
+        # Bandwidths supported by the active modem, cached until the modem changes
+        self._available_bandwidths = ()
+        self._max_allowed_bw = None
+        self._refresh_available_bandwidths()
+
+        # Initialize status labels (none are created by the current layout)
+        self.status_labels = StatusLabels()
+
+        # Last text/style applied to each monitoring label (see _set_label)
+        self._label_state = {}
+
+        # Settings dialog, created on first open and reused afterwards
+        self._settings_dialog = None
+
+        # Message boxes and WAV file dialogs are created on first use and then reused
+        self._warn_box = None
+        self._err_box = None
+        self._save_dialog = None
+        self._load_dialog = None
+
+        # Control changes are saved together once they settle (see _schedule_config_save)
+        self._config_dirty = False
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(500)
+        self._config_flush_timer.timeout.connect(self._flush_config)
 
         # Set up window properties
         self.setWindowTitle("SSDigi Modem")
@@ -63,46 +179,70 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
 
+        # The rig stays visible in a permanent widget so transient messages cannot hide it
+        self.radio_label = QLabel()
+        self.status_bar.addPermanentWidget(self.radio_label)
+
         # Create control panel
         self.setup_control_panel()
 
         # Update status bar with basic info
         self.update_status_bar()
 
+        # Preallocated spectrum buffers, filled in place every frame
+        self._allocate_fft_buffers()
+
         # Start timers for UI updates
         self.start_timers()
 
+        # Let the modem push FFT frames instead of being polled for them every tick
+        self._last_fft_push = None
+        self.modemFftReceived.connect(self._on_modem_fft, Qt.QueuedConnection)
+        self.modem_manager.set_fft_callback(self.modemFftReceived.emit)
+
+        # Rig status is pushed on change instead of polled every second
+        self.hamlibStatusChanged.connect(self._on_hamlib_status, Qt.QueuedConnection)
+        self.hamlib_manager.set_status_callback(self.hamlibStatusChanged.emit)
+
+        # Enumerate audio devices in the background so startup is not blocked on the OS
+        self._device_worker = None
+        self.enumerate_audio_devices()
+
     def setup_menu_bar(self):
         """Set up the application menu bar"""
+        # (menu title, [(action text, slot, attribute to keep the action as) or None for a separator])
+        menus = [
+            ("&File", [
+                ("&Save Audio to WAV", self.save_wav_file, 'save_wav_action'),
+                ("&Load Audio File", self.load_wav_file, 'load_wav_action'),
+                None,
+                ("E&xit", self.close, None),
+            ]),
+            ("&Modem", [
+                ("&Settings", self.open_settings, None),
+                # Device lists are cached by the audio manager until refreshed
+                ("&Refresh Audio Devices", self.refresh_audio_devices, None),
+            ]),
+            ("&Help", [
+                ("&About", self.open_about_dialog, None),
+            ]),
+        ]
+
         menu_bar = self.menuBar()
-        # File menu
-        file_menu = menu_bar.addMenu("&File")
-        # Save/Load WAV actions
-        save_wav_action = QAction("&Save Audio to WAV", self)
-        save_wav_action.triggered.connect(self.save_wav_file)
-        file_menu.addAction(save_wav_action)
-        load_wav_action = QAction("&Load Audio from WAV", self)
-        load_wav_action.triggered.connect(self.load_wav_file)
-        file_menu.addAction(load_wav_action)
-        file_menu.addSeparator()
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        # Modem menu
-        modem_menu = menu_bar.addMenu("&Modem")
-
-        # Settings action
-        settings_action = QAction("&Settings", self)
-        settings_action.triggered.connect(self.open_settings)
-        modem_menu.addAction(settings_action)
-
-        # Help menu
-        help_menu = menu_bar.addMenu("&Help")
-        # About action
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.open_about_dialog)
-        help_menu.addAction(about_action)
+        for title, items in menus:
+            actions = []
+            for item in items:
+                action = QAction(self)
+                if item is None:
+                    action.setSeparator(True)
+                else:
+                    text, slot, attr = item
+                    action.setText(text)
+                    action.triggered.connect(slot)
+                    if attr:
+                        setattr(self, attr, action)
+                actions.append(action)
+            menu_bar.addMenu(title).addActions(actions)
 
     def setup_control_panel(self):
         """Set up the control panel with modem controls"""
@@ -153,29 +293,26 @@ class MainWindow(QMainWindow):
         # Add buttons to control layout
         control_layout.addWidget(self.connect_button)
 
+        # Low-latency audio: small blocks sized from the modem bandwidth
+        self.low_latency_checkbox = QCheckBox("Low latency")
+        self.low_latency_checkbox.setToolTip("Use a small audio block size derived from the modem bandwidth")
+        self.low_latency_checkbox.setChecked(self.audio_manager.low_latency)
+        self.low_latency_checkbox.toggled.connect(self.on_low_latency_toggled)
+        control_layout.addWidget(self.low_latency_checkbox)
+
         # Add monitoring section
         monitoring_group = QGroupBox("Monitoring")
         monitoring_layout = QGridLayout()
         monitoring_group.setLayout(monitoring_layout)
 
         # Style for monitoring labels
-        value_style = """
-            QLabel {
-                color: #2196F3;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                padding: 2px;
-                border: 1px solid #404040;
-                background: #1a1a1a;
-                border-radius: 2px;
-            }
-        """
+        value_style = _STYLE_NORMAL
 
         # RX/TX Status
         self.rx_indicator = QLabel("RX")
         self.tx_indicator = QLabel("TX")
-        self.rx_indicator.setStyleSheet("QLabel { color: gray; }")
-        self.tx_indicator.setStyleSheet("QLabel { color: gray; }")
+        self.rx_indicator.setStyleSheet(_STYLE_INDICATOR_OFF)
+        self.tx_indicator.setStyleSheet(_STYLE_INDICATOR_OFF)
         monitoring_layout.addWidget(QLabel("Status:"), 0, 0)
         status_box = QHBoxLayout()
         status_box.addWidget(self.rx_indicator)
@@ -252,29 +389,51 @@ class MainWindow(QMainWindow):
         # Create visualization container
         vis_container = QWidget()
         vis_container.setContentsMargins(2, 2, 2, 2)
-        vis_container_layout = QVBoxLayout(vis_container)
-        vis_container_layout.setSpacing(0)
-        vis_container_layout.setContentsMargins(0, 5, 0, 0)  # Add some padding at top
+        self.vis_container_layout = QVBoxLayout(vis_container)
+        self.vis_container_layout.setSpacing(0)
+        self.vis_container_layout.setContentsMargins(0, 5, 0, 0)  # Add some padding at top
+
+        # The views themselves are built on first show (see _build_visualizations)
+        self.waterfall_view = None
+        self.spectrum_view = None
 
+        # Add the container to the panel layout
+        vis_layout.addWidget(vis_container)
+
+        # Add visualization panel to main layout with stretch
+        main_control_layout.addWidget(vis_panel, 1)
+
+        # Add main layout to window
+        self.main_layout.addLayout(main_control_layout)
+
+    def _build_visualizations(self):
+        """Create the waterfall and spectrum views and their image buffers"""
         # Create waterfall view with proper size
         self.waterfall_view = WaterfallView(self.config)
         self.waterfall_view.setMinimumWidth(400)
-        vis_container_layout.addWidget(self.waterfall_view)
+        self.vis_container_layout.addWidget(self.waterfall_view)
 
         # Create spectrum view with proper size
         self.spectrum_view = SpectrumView(self.config)
         self.spectrum_view.setMinimumSize(400, 130)
         self.spectrum_view.setMaximumHeight(150)
-        vis_container_layout.addWidget(self.spectrum_view)
+        self.vis_container_layout.addWidget(self.spectrum_view)
 
-        # Add the container to the panel layout
-        vis_layout.addWidget(vis_container)
+        # Both views paint their whole rect every frame, so skip Qt's background fill
+        for view in (self.spectrum_view, self.waterfall_view):
+            view.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            view.setAttribute(Qt.WA_NoSystemBackground, True)
+            view.setAutoFillBackground(False)
 
-        # Add visualization panel to main layout with stretch
-        main_control_layout.addWidget(vis_panel, 1)
+        # Feed both views from a single per-frame signal
+        self.fftReady.connect(self.spectrum_view.update_with_data)
+        self.fftReady.connect(self.waterfall_view.update_waterfall)
 
-        # Add main layout to window
-        self.main_layout.addLayout(main_control_layout)
+    def showEvent(self, event):
+        """Build the visualizations the first time the window is shown"""
+        super().showEvent(event)
+        if self.waterfall_view is None:
+            self._build_visualizations()
 
     def setup_feature_tabs(self):
         """Placeholder for future feature tabs"""
@@ -282,32 +441,58 @@ class MainWindow(QMainWindow):
 
     def start_timers(self):
         """Start timers for UI updates"""
-        # Spectrum update timer
-        self.spectrum_timer = QTimer(self)
-        self.spectrum_timer.timeout.connect(self.update_spectrum)
-        update_rate = self.config.get('ui', 'spectrum_update_rate')
-        self.spectrum_timer.start(1000 // update_rate)  # Convert Hz to ms
+        # Single master timer at the spectrum rate; slower updates run every N frames
+        self._frame = 0
+        self._master_timer = QTimer(self)
+        self._master_timer.timeout.connect(self._on_tick)
+        self._set_update_rate(self.config.get('ui', 'spectrum_update_rate'))
+
+    def _set_update_rate(self, update_rate):
+        """(Re)start the master timer at update_rate Hz"""
+        self._update_rate = max(1, int(update_rate))
+        self._master_timer.start(1000 // self._update_rate)  # Convert Hz to ms
+
+    @pyqtSlot()
+    def _on_tick(self):
+        """Drive all periodic UI updates from the master timer"""
+        self.update_spectrum()
 
-        # Status update timer
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Update every second
+        # Status once per second
+        if self._frame % self._update_rate == 0:
+            self.update_status()
+        self._frame += 1
 
     def update_spectrum(self):
         """Update spectrum and waterfall with new data"""
-        # Get FFT data from modem
-        fft_data = self.modem_manager.get_fft_data()
+        # Nothing to draw while the window is hidden or minimized, or before the views exist
+        if self.spectrum_view is None or not self.isVisible() or self.isMinimized():
+            return
+
+        # While disconnected, show one static demo frame instead of synthesizing noise every tick
+        if not self.modem_manager.is_connected():
+            if not self._demo_pushed:
+                self._demo_pushed = True
+                self.fftReady.emit(self._demo_fft)
+            return
+        self._demo_pushed = False
+
+        # While the modem is pushing frames (within the last second) they drive the views
+        if self._last_fft_push is not None and self._frame - self._last_fft_push <= self._update_rate:
+            return
+
+        # Get FFT data from modem, written straight into the preallocated buffer
+        fft_data = self._fft_buf if self.modem_manager.fill_fft_data(self._fft_buf) else None
 
         # If no FFT data, try to use latest input audio
         if fft_data is None:
-            if hasattr(self, 'audio_manager') and self.audio_manager.input_buffer:
-                # Get the latest audio chunk
-                audio_chunk = self.audio_manager.input_buffer[-1]
+            fft_size = self._fft_size
+            audio_chunk = None
+            if hasattr(self, 'audio_manager'):
+                # Get the latest audio samples
+                audio_chunk = self.audio_manager.get_latest_samples(fft_size)
+            if audio_chunk is not None:
                 # Ensure it's the right size for FFT
-                fft_size = self.config.get('ui', 'fft_size', 2048)
-                if len(audio_chunk) >= fft_size:
-                    audio_chunk = audio_chunk[-fft_size:]
-                else:
+                if len(audio_chunk) < fft_size:
                     # Pad with zeros if too short
                     audio_chunk = np.pad(audio_chunk, (0, fft_size - len(audio_chunk)), 'constant')
                 # Compute FFT and convert to dB
@@ -317,29 +502,61 @@ class MainWindow(QMainWindow):
             else:
                 return
 
-        # Apply FFT averaging if enabled
-        if self.config.get('ui', 'fft_average', True):
-            avg_frames = self.config.get('ui', 'fft_average_frames', 2)
-            if not hasattr(self, 'fft_avg_buffer'):
-                self.fft_avg_buffer = []
-
-            # Add current data to buffer
-            self.fft_avg_buffer.append(fft_data)
-
-            # Keep only the most recent frames for averaging
-            while len(self.fft_avg_buffer) > avg_frames:
-                self.fft_avg_buffer.pop(0)
-
-            # Average the frames
-            if len(self.fft_avg_buffer) > 0:
-                avg_data = np.zeros_like(self.fft_avg_buffer[0])
-                for frame in self.fft_avg_buffer:
-                    avg_data += frame
-                avg_data /= len(self.fft_avg_buffer)
-                fft_data = avg_data
-
-        self.spectrum_view.update_with_data(fft_data)
-        self.waterfall_view.update_waterfall(fft_data)
+        self._emit_fft(fft_data)
+
+    @pyqtSlot(object)
+    def _on_modem_fft(self, fft_data):
+        """Handle an FFT frame pushed by the modem"""
+        self._last_fft_push = self._frame
+        if self.isVisible() and not self.isMinimized():
+            self._emit_fft(fft_data)
+
+    def _emit_fft(self, fft_data):
+        """Average an FFT frame if enabled and send it to the views"""
+        # Apply FFT averaging if enabled, over a fixed ring of the most recent frames
+        if self._fft_average and len(fft_data) == self._fft_avg_ring.shape[1]:
+            self._fft_avg_ring[self._fft_avg_pos] = fft_data
+            self._fft_avg_pos = (self._fft_avg_pos + 1) % len(self._fft_avg_ring)
+            self._fft_avg_count = min(self._fft_avg_count + 1, len(self._fft_avg_ring))
+            np.mean(self._fft_avg_ring[:self._fft_avg_count], axis=0, out=self._fft_avg_out)
+            fft_data = self._fft_avg_out
+
+        self.fftReady.emit(fft_data)
+
+    def _allocate_fft_buffers(self):
+        """Allocate the per-frame FFT and averaging buffers for the configured FFT size"""
+        # The per-frame paths read these snapshots instead of looking the settings up every tick
+        ui_cfg = self.config.get('ui')
+        self._fft_size = ui_cfg.get('fft_size', 2048)
+        self._fft_average = ui_cfg.get('fft_average', True)
+        bins = self._fft_size // 2
+        avg_frames = max(1, ui_cfg.get('fft_average_frames', 2))
+        self._fft_buf = np.empty(bins, dtype=np.float32)
+        self._fft_avg_ring = np.zeros((avg_frames, bins), dtype=np.float32)
+        self._fft_avg_out = np.empty(bins, dtype=np.float32)
+        self._fft_avg_pos = 0
+        self._fft_avg_count = 0
+
+        # Static noise floor shown while disconnected, pushed once per disconnect
+        self._demo_fft = np.random.default_rng().standard_normal(bins, dtype=np.float32) - 80
+        self._demo_pushed = False
+
+    def closeEvent(self, event):
+        """Write any pending control changes and stop the waterfall worker before the window closes"""
+        self._config_flush_timer.stop()
+        self._flush_config()
+        if self.waterfall_view is not None:
+            self.waterfall_view.stop_worker()
+        super().closeEvent(event)
+
+    def changeEvent(self, event):
+        """Pause periodic UI updates while the window is minimized"""
+        if event.type() == QEvent.WindowStateChange and hasattr(self, '_master_timer'):
+            if self.isMinimized():
+                self._master_timer.stop()
+            elif not self._master_timer.isActive():
+                self._master_timer.start()
+        super().changeEvent(event)
 
     def update_status(self):
         """Update status displays"""
@@ -355,49 +572,29 @@ class MainWindow(QMainWindow):
             # RX/TX Indicators
             rx_active = status.get('rx_active', False)
             tx_active = status.get('tx_active', False)
-            self.rx_indicator.setStyleSheet(
-                "QLabel { color: #00ff00; font-weight: bold; }" if rx_active else "QLabel { color: gray; }"
-            )
-            self.tx_indicator.setStyleSheet(
-                "QLabel { color: #ff0000; font-weight: bold; }" if tx_active else "QLabel { color: gray; }"
-            )
+            self._set_label(self.rx_indicator, style=_STYLE_RX_ON if rx_active else _STYLE_INDICATOR_OFF)
+            self._set_label(self.tx_indicator, style=_STYLE_TX_ON if tx_active else _STYLE_INDICATOR_OFF)
 
             # Signal to Noise Ratio
             snr = status.get('snr', 0)
-            self.snr_label.setText(f"{snr:+.1f} dB")
+            self._set_label(self.snr_label, f"{snr:+.1f} dB")
 
-            # CPU Usage
+            # CPU Usage, red when high
             cpu = status.get('cpu_usage', 0)
-            self.cpu_label.setText(f"{cpu:.1f}%")
-            value_style = """
-                QLabel {
-                    color: %s;
-                    font-family: 'Consolas', monospace;
-                    font-size: 12px;
-                    padding: 2px;
-                    border: 1px solid #404040;
-                    background: #1a1a1a;
-                    border-radius: 2px;
-                }
-            """
-            if cpu > 80:
-                self.cpu_label.setStyleSheet(value_style % "#ff0000")  # Red when high
-            else:
-                self.cpu_label.setStyleSheet(value_style % "#2196F3")
+            self._set_label(self.cpu_label, f"{cpu:.1f}%", _STYLE_ALERT if cpu > 80 else _STYLE_NORMAL)
 
             # VU Meter (audio level)
             vu = status.get('audio_level', -60)
-            self.vu_label.setText(f"{vu:.1f} dB")
+            self._set_label(self.vu_label, f"{vu:.1f} dB")
 
             # AFC Status
             afc_offset = status.get('afc_offset', 0)
-            self.afc_label.setText(f"±{abs(afc_offset):.0f} Hz")            # Buffer Status
+            self._set_label(self.afc_label, f"±{abs(afc_offset):.0f} Hz")
+
+            # Buffer Status, red when near full
             buffer_used = status.get('buffer_used', 0)
-            self.buffer_label.setText(f"{buffer_used:.0f}%")
-            if buffer_used > 90:
-                self.buffer_label.setStyleSheet(value_style % "#ff0000")  # Red when near full
-            else:
-                self.buffer_label.setStyleSheet(value_style % "#2196F3")
+            self._set_label(self.buffer_label, f"{buffer_used:.0f}%",
+                            _STYLE_ALERT if buffer_used > 90 else _STYLE_NORMAL)
 
             # Decoded Frame (for ARDOP mode)
             if is_ardop_mode:
@@ -407,20 +604,34 @@ class MainWindow(QMainWindow):
                     # Truncate if too long
                     if len(decoded_frame) > 10:
                         decoded_frame = decoded_frame[:8] + "..."
-                    self.decoded_frame_label.setText(decoded_frame)
-                    self.decoded_frame_label.setStyleSheet(value_style % "#00ff00")  # Green for active frame
+                    self._set_label(self.decoded_frame_label, decoded_frame, _STYLE_ACTIVE)  # Green for active frame
                 else:
-                    self.decoded_frame_label.setText("---")
-                    self.decoded_frame_label.setStyleSheet(value_style % "#2196F3")  # Default color
+                    self._set_label(self.decoded_frame_label, "---", _STYLE_NORMAL)  # Default color
             else:
                 # Non-ARDOP mode - hide or show placeholder
-                self.decoded_frame_label.setText("---")
-                self.decoded_frame_label.setStyleSheet(value_style % "#2196F3")
+                self._set_label(self.decoded_frame_label, "---", _STYLE_NORMAL)
 
-            # Update HAMLIB status if enabled
-            if self.hamlib_manager.is_connected():
-                hamlib_status = self.hamlib_manager.get_status()
-                self.status_bar.showMessage(f"Radio: {hamlib_status.get('rig_model', 'Unknown')}")
+    @pyqtSlot(dict)
+    def _on_hamlib_status(self, hamlib_status):
+        """Show the rig in the status bar while both HAMLIB and the modem are connected"""
+        if hamlib_status.get('connected') and self.modem_manager.is_connected():
+            self._set_label(self.radio_label, f"Radio: {hamlib_status.get('rig_model', 'Unknown')}")
+        else:
+            self._set_label(self.radio_label, "")
+
+    def _set_label(self, label, text=None, style=None):
+        """Update a label's text and/or style sheet, skipping values it already shows
+
+        An unchanged setStyleSheet still re-polishes the widget, so both are compared
+        against the last values applied here.
+        """
+        last = self._label_state.setdefault(label, [None, None])
+        if text is not None and text != last[0]:
+            label.setText(text)
+            last[0] = text
+        if style is not None and style != last[1]:
+            label.setStyleSheet(style)
+            last[1] = style
 
     def update_status_bar(self):
         """Update status bar with basic information"""
@@ -450,7 +661,7 @@ class MainWindow(QMainWindow):
                 # Reset button state
                 self.connect_button.setText("Connect")
                 self.connect_button.setEnabled(True)
-                QMessageBox.warning(self, "Connection Error",
+                self._show_warning("Connection Error",
                                    "Please configure audio devices in Settings first")
                 self.open_settings()
                 return
@@ -464,9 +675,9 @@ class MainWindow(QMainWindow):
                 # Reset button state
                 self.connect_button.setText("Connect")
                 self.connect_button.setEnabled(True)
-                QMessageBox.warning(self, "Missing Callsign",
-                                  "A valid callsign is required to connect to the modem.\n"
-                                  "Please set your callsign in Modem > Settings > Station.")
+                self._show_warning("Missing Callsign",
+                                   "A valid callsign is required to connect to the modem.\n"
+                                   "Please set your callsign in Modem > Settings > Station.")
                 logger.error("Connection attempt failed: No callsign configured")
                 return
 
@@ -479,19 +690,20 @@ class MainWindow(QMainWindow):
                 self.disconnect_button.setEnabled(False)
                 self.disconnect_button.hide()
                 self.status_bar.showMessage("Modem connected", 3000)
+                self._on_hamlib_status(self.hamlib_manager.get_status())
                 logger.info("Modem connected successfully")
             else:
                 # Reset button state
                 self.connect_button.setText("Connect")
                 self.connect_button.setEnabled(True)
-                QMessageBox.warning(self, "Connection Error",
-                                  "Failed to connect to modem. Check settings and try again.")
+                self._show_warning("Connection Error",
+                                   "Failed to connect to modem. Check settings and try again.")
                 logger.error("Failed to connect to modem")
         except Exception as e:
             # Reset button state on error
             self.connect_button.setText("Connect")
             self.connect_button.setEnabled(True)
-            QMessageBox.critical(self, "Error", f"Error connecting to modem: {str(e)}")
+            self._show_error("Error", f"Error connecting to modem: {str(e)}")
             logger.exception("Error connecting to modem")
 
     @pyqtSlot()
@@ -504,19 +716,20 @@ class MainWindow(QMainWindow):
             self.connect_button.setEnabled(True)
             # No need to modify disconnect button visibility anymore
             self.status_bar.showMessage("Modem disconnected", 3000)
+            self._on_hamlib_status(self.hamlib_manager.get_status())
 
             # Update status labels if they exist
-            if hasattr(self, 'status_labels'):
-                if 'connection' in self.status_labels:
-                    self.status_labels['connection'].setText("Disconnected")
-                if 'snr' in self.status_labels:
-                    self.status_labels['snr'].setText("N/A")
-                if 'signal' in self.status_labels:
-                    self.status_labels['signal'].setText("N/A")
+            labels = self.status_labels
+            if labels.connection is not None:
+                labels.connection.setText("Disconnected")
+            if labels.snr is not None:
+                labels.snr.setText("N/A")
+            if labels.signal is not None:
+                labels.signal.setText("N/A")
 
             logger.info("Modem disconnected")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error disconnecting modem: {str(e)}")
+            self._show_error("Error", f"Error disconnecting modem: {str(e)}")
             logger.exception("Error disconnecting modem")
 
     @pyqtSlot()
@@ -536,11 +749,11 @@ class MainWindow(QMainWindow):
 
                 logger.info("HAMLIB connected successfully")
             else:
-                QMessageBox.warning(self, "HAMLIB Connection Error",
-                                  "Failed to connect to HAMLIB. Check settings and try again.")
+                self._show_warning("HAMLIB Connection Error",
+                                   "Failed to connect to HAMLIB. Check settings and try again.")
                 logger.error("Failed to connect to HAMLIB")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error connecting to HAMLIB: {str(e)}")
+            self._show_error("Error", f"Error connecting to HAMLIB: {str(e)}")
             logger.exception("Error connecting to HAMLIB")
 
     @pyqtSlot()
@@ -559,28 +772,69 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("HAMLIB disconnected", 3000)
             logger.info("HAMLIB disconnected")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error disconnecting HAMLIB: {str(e)}")
+            self._show_error("Error", f"Error disconnecting HAMLIB: {str(e)}")
             logger.exception("Error disconnecting HAMLIB")    # Removed audio device change handlers as they're now handled in the settings dialog
 
+    def _refresh_available_bandwidths(self):
+        """Re-query the bandwidths supported by the active modem"""
+        try:
+            self._available_bandwidths = tuple(self.modem_manager.get_available_bandwidths())
+        except NotImplementedError:
+            self._available_bandwidths = ()
+        self._max_allowed_bw = max(self._available_bandwidths, default=None)
+
+        # Grey out unsupported entries so they cannot be picked in the first place
+        if hasattr(self, 'bandwidth_combo') and self._available_bandwidths:
+            model = self.bandwidth_combo.model()
+            for i in range(self.bandwidth_combo.count()):
+                model.item(i).setEnabled(self.bandwidth_combo.itemData(i) in self._available_bandwidths)
+
+    def _schedule_config_save(self):
+        """Write the config once control changes settle instead of on every change"""
+        self._config_dirty = True
+        self._config_flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_config(self):
+        """Write pending control changes to the config file"""
+        if self._config_dirty:
+            self._config_dirty = False
+            self.config.save()
+
     @pyqtSlot(int)
     def on_bandwidth_changed(self, index):
         """Handle bandwidth selection change"""
         bandwidth = self.bandwidth_combo.currentData()
+        if self._max_allowed_bw is not None and bandwidth > self._max_allowed_bw:
+            bandwidth = self._max_allowed_bw
 
         self.config.set('modem', 'bandwidth', bandwidth)
-        self.config.save()
-        self.status_labels['bandwidth'].setText(f"{bandwidth} Hz")
+        self._schedule_config_save()
+        if self.status_labels.bandwidth is not None:
+            self.status_labels.bandwidth.setText(f"{bandwidth} Hz")
 
         # Update modem if connected
         if self.modem_manager.is_connected():
             self.modem_manager.set_bandwidth(bandwidth)
 
+        # The low-latency block size follows the bandwidth
+        if self.audio_manager.low_latency:
+            self.audio_manager.set_latency_mode(True, bandwidth)
+
+    @pyqtSlot(bool)
+    def on_low_latency_toggled(self, checked):
+        """Handle low-latency checkbox toggle"""
+        self.config.set('audio', 'low_latency', checked)
+        self._schedule_config_save()
+        if not self.audio_manager.set_latency_mode(checked):
+            self._show_warning("Audio Error", "Failed to reopen audio streams with the new block size")
+
     @pyqtSlot(int)
     def on_center_freq_changed(self, index):
         """Handle center frequency selection change"""
         center_freq = self.center_freq_combo.currentData()
         self.config.set('modem', 'center_freq', center_freq)
-        self.config.save()
+        self._schedule_config_save()
 
         # Update modem if connected
         if self.modem_manager.is_connected():
@@ -589,52 +843,142 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def save_wav_file(self):
         """Save current audio to WAV file"""
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Audio", "", "WAV Files (*.wav)")
+        file_path = self._choose_wav_file(save=True)
         if file_path:
-            try:
-                if self.modem_manager.save_to_wav(file_path):
-                    self.status_bar.showMessage(f"Audio saved to {file_path}", 3000)
-                else:
-                    QMessageBox.warning(self, "Save Failed", "Failed to save audio to WAV file")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error saving WAV file: {str(e)}")
-                logger.exception("Error saving WAV file")
+            self._start_wav_io(self.modem_manager.save_to_wav, file_path, "save")
 
     @pyqtSlot()
     def load_wav_file(self):
-        """Load audio from WAV file"""
-        file_path, _ = QFileDialog.getOpenFileName(self, "Load Audio", "", "WAV Files (*.wav)")
+        """Load audio from a WAV, MP3, FLAC or other ffmpeg-decodable file"""
+        file_path = self._choose_wav_file(save=False)
         if file_path:
-            try:
-                if self.modem_manager.load_from_wav(file_path):
-                    self.status_bar.showMessage(f"Audio loaded from {file_path}", 3000)
-                else:
-                    QMessageBox.warning(self, "Load Failed", "Failed to load audio from WAV file")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error loading WAV file: {str(e)}")
-                logger.exception("Error loading WAV file")
+            self._start_wav_io(self._load_audio_file, file_path, "load")
 
-    @pyqtSlot()
-    def open_settings(self):
-        """Open the settings dialog"""
-        settings_dialog = SettingsDialog(self.config, self)
-        if settings_dialog.exec_() == QDialog.Accepted:
-            # Apply settings
-            self.config.save()
+    def _load_audio_file(self, file_path):
+        """Decode an audio file into the audio manager; WAV files also go to the modem"""
+        if not self.audio_manager.load_audio(file_path):
+            return False
+        if file_path.lower().endswith('.wav'):
+            return self.modem_manager.load_from_wav(file_path)
+        return True
 
-            # Refresh audio devices
-            settings_dialog._refresh_audio_devices()
+    def _choose_wav_file(self, save):
+        """Ask for an audio file path (WAV only when saving) using the reusable save/load dialog
 
-            # Update spectrum and waterfall views with new settings
-            self.spectrum_view.update_settings(self.config)
-            self.waterfall_view.update_settings(self.config)
+        Returns:
+            str: Selected path, or None if the dialog was cancelled
+        """
+        dialog = self._save_dialog if save else self._load_dialog
+        if dialog is None:
+            file_filter = "WAV Files (*.wav)" if save else \
+                "Audio Files (*.wav *.mp3 *.flac *.ogg *.m4a);;WAV Files (*.wav);;All Files (*)"
+            dialog = QFileDialog(self, "Save Audio" if save else "Load Audio", "", file_filter)
+            if save:
+                dialog.setAcceptMode(QFileDialog.AcceptSave)
+                self._save_dialog = dialog
+            else:
+                dialog.setFileMode(QFileDialog.ExistingFile)
+                self._load_dialog = dialog
+
+        if dialog.exec_() != QDialog.Accepted:
+            return None
+        files = dialog.selectedFiles()
+        return files[0] if files else None
+
+    def _show_warning(self, title, text):
+        """Show a modal warning using the reusable warning box"""
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, "", "", QMessageBox.Ok, self)
+        self._show_message(self._warn_box, title, text)
+
+    def _show_error(self, title, text):
+        """Show a modal error using the reusable error box"""
+        if self._err_box is None:
+            self._err_box = QMessageBox(QMessageBox.Critical, "", "", QMessageBox.Ok, self)
+        self._show_message(self._err_box, title, text)
+
+    def _show_message(self, box, title, text):
+        """Retitle a reusable message box and run it modally"""
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
+
+    def _start_wav_io(self, func, file_path, action):
+        """Run a WAV save/load on the thread pool, keeping the UI responsive meanwhile"""
+        self._wav_io = (action, file_path)
+        self.save_wav_action.setEnabled(False)
+        self.load_wav_action.setEnabled(False)
+        self.status_bar.showMessage(f"{'Saving audio to' if action == 'save' else 'Loading audio from'} {file_path}...")
+
+        self._wav_worker = WavIOWorker(func, file_path)
+        self._wav_worker.signals.finished.connect(self._on_wav_io_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._wav_worker)
+
+    @pyqtSlot(bool, str)
+    def _on_wav_io_finished(self, ok, error):
+        """Report the result of a WAV save/load"""
+        action, file_path = self._wav_io
+        self._wav_worker = None
+        self.save_wav_action.setEnabled(True)
+        self.load_wav_action.setEnabled(True)
+        self.status_bar.clearMessage()
+
+        if action == 'save':
+            if ok:
+                self.status_bar.showMessage(f"Audio saved to {file_path}", 3000)
+            elif error:
+                self._show_error("Error", f"Error saving WAV file: {error}")
+            else:
+                self._show_warning("Save Failed", "Failed to save audio to WAV file")
+        else:
+            if ok:
+                self.status_bar.showMessage(f"Audio loaded from {file_path}", 3000)
+            elif error:
+                self._show_error("Error", f"Error loading WAV file: {error}")
+            else:
+                self._show_warning("Load Failed", "Failed to load audio from WAV file")
 
-            # Update modem with new settings
-            self.modem_manager.apply_config()
+    @pyqtSlot()
+    def open_settings(self):
+        """Open the settings dialog"""
+        # Apply/Cancel only; each Apply saves the config and calls update_from_config
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.config, self)
+        self._settings_dialog.exec_()
 
-            # Update spectrum refresh rate
-            update_rate = self.config.get('ui', 'spectrum_update_rate')
-            self.spectrum_timer.start(1000 // update_rate)  # Convert Hz to ms
+    @pyqtSlot()
+    def refresh_audio_devices(self):
+        """Drop the cached audio device lists so newly attached devices are found"""
+        if self._device_worker is not None:
+            self.status_bar.showMessage("Audio devices are already being enumerated", 3000)
+            return
+        self.audio_manager.refresh_devices()
+        self.enumerate_audio_devices()
+
+    def enumerate_audio_devices(self):
+        """Start enumerating audio devices on the global thread pool"""
+        self._device_worker = DeviceEnumWorker(self.audio_manager)
+        self._device_worker.signals.finished.connect(self._on_devices_enumerated, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._device_worker)
+
+    @pyqtSlot(list, list)
+    def _on_devices_enumerated(self, input_devices, output_devices):
+        """Check the configured audio devices against the enumerated ones"""
+        self._device_worker = None
+
+        input_idx = self.config.get('audio', 'input_device')
+        output_idx = self.config.get('audio', 'output_device')
+        missing = []
+        if input_idx is not None and all(index != input_idx for _, index in input_devices):
+            missing.append("input")
+        if output_idx is not None and all(index != output_idx for _, index in output_devices):
+            missing.append("output")
+
+        if missing:
+            self.status_bar.showMessage(f"Configured audio {' and '.join(missing)} device not found", 5000)
+        else:
+            self.status_bar.showMessage(
+                f"Found {len(input_devices)} input and {len(output_devices)} output audio devices", 3000)
 
     @pyqtSlot()
     def open_about_dialog(self):
@@ -654,15 +998,45 @@ class MainWindow(QMainWindow):
         if hasattr(self.modem_manager, 'update_from_config'):
             self.modem_manager.update_from_config()
 
-        # Update UI elements that depend on configuration
-        current_bw = self.config.get('modem', 'bandwidth')
-        index = self.bandwidth_combo.findData(current_bw)
-        if index >= 0:
-            self.bandwidth_combo.setCurrentIndex(index)
+        # The mode may have changed, so re-query its bandwidths before syncing the combos
+        self._refresh_available_bandwidths()
+
+        # Update UI elements that depend on configuration. Their change slots are blocked:
+        # each would save the config and reconfigure the modem/audio once per control
+        audio_cfg = self.config.get('audio')
+        modem_cfg = self.config.get('modem')
+        low_latency = audio_cfg.get('low_latency', False)
+        controls = [(self.low_latency_checkbox, None)]
+        for name, key in (('bandwidth_combo', 'bandwidth'), ('center_freq_combo', 'center_freq')):
+            if hasattr(self, name):
+                controls.append((getattr(self, name), key))
+
+        blockers = [QSignalBlocker(control) for control, _ in controls]
+        try:
+            self.low_latency_checkbox.setChecked(low_latency)
+            for combo, key in controls[1:]:
+                index = combo.findData(modem_cfg.get(key))
+                if index >= 0:
+                    combo.setCurrentIndex(index)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+        # Apply the audio side once (the modem manager already applied its settings above)
+        self.audio_manager.set_latency_mode(low_latency)
 
         # Update status labels
-        self.status_labels['mode'].setText(self.config.get('modem', 'mode'))
-        self.status_labels['bandwidth'].setText(f"{self.config.get('modem', 'bandwidth')} Hz")
+        if self.status_labels.mode is not None:
+            self.status_labels.mode.setText(modem_cfg.get('mode'))
+        if self.status_labels.bandwidth is not None:
+            self.status_labels.bandwidth.setText(f"{modem_cfg.get('bandwidth')} Hz")
+
+        # Update spectrum and waterfall views and their refresh rate
+        self._allocate_fft_buffers()
+        if self.spectrum_view is not None:
+            self.spectrum_view.update_settings(self.config)
+            self.waterfall_view.update_settings(self.config)
+        self._set_update_rate(self.config.get('ui', 'spectrum_update_rate'))
 
     def _save_log(self):
         """Save the log to a file"""
@@ -673,11 +1047,12 @@ class MainWindow(QMainWindow):
                     f.write(self.log_text.toPlainText())
                 self.status_bar.showMessage(f"Log saved to {file_path}", 3000)
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error saving log: {str(e)}")
+                self._show_error("Error", f"Error saving log: {str(e)}")
 
     def add_station(self, callsign, freq, snr, mode):
         """Add or update a station in the stations list"""
         current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        heard_at = time.monotonic()  # Kept alongside the display text for _clear_inactive_stations
         freq_str = f"{freq:.0f}"
         station_color = QColor(30, 30, 30)
         highlight_color = QColor(40, 80, 120)
@@ -690,6 +1065,7 @@ class MainWindow(QMainWindow):
                 self.stations_table.item(row, 2).setText(str(snr))
                 self.stations_table.item(row, 3).setText(mode)
                 self.stations_table.item(row, 4).setText(current_time)
+                self.stations_table.item(row, 4).setData(Qt.UserRole, heard_at)
 
                 # Highlight row briefly to show update
                 for col in range(self.stations_table.columnCount()):
@@ -703,8 +1079,9 @@ class MainWindow(QMainWindow):
 
         if not self.track_all_freqs:
             # Check if frequency is within current modem bandwidth
-            center_freq = self.config.get('modem', 'center_freq')
-            bandwidth = self.config.get('modem', 'bandwidth')
+            modem_cfg = self.config.get('modem')
+            center_freq = modem_cfg.get('center_freq')
+            bandwidth = modem_cfg.get('bandwidth')
             if abs(freq - center_freq) > bandwidth / 2:
                 return
 
@@ -723,6 +1100,7 @@ class MainWindow(QMainWindow):
         # Make frequency and SNR sort numerically
         items[1].setData(Qt.UserRole, float(freq))
         items[2].setData(Qt.UserRole, float(snr))
+        items[4].setData(Qt.UserRole, heard_at)
 
         # Add items to row with background color
         for col, item in enumerate(items):
@@ -740,20 +1118,12 @@ class MainWindow(QMainWindow):
 
     def _clear_inactive_stations(self):
         """Remove stations that haven't been heard in the last 10 minutes"""
-        current_time = datetime.datetime.now()
+        cutoff = time.monotonic() - 600  # 10 minutes
         rows_to_remove = []
 
+        # Compare the stored timestamps rather than re-parsing the "Last Heard" text
         for row in range(self.stations_table.rowCount()):
-            last_heard = datetime.datetime.strptime(
-                self.stations_table.item(row, 4).text(),
-                "%H:%M:%S"
-            ).replace(
-                year=current_time.year,
-                month=current_time.month,
-                day=current_time.day
-            )
-
-            if (current_time - last_heard).total_seconds() > 600:  # 10 minutes
+            if self.stations_table.item(row, 4).data(Qt.UserRole) < cutoff:
                 rows_to_remove.append(row)
 
         # Remove rows from bottom to top to avoid index issues
@@ -764,7 +1134,7 @@ class MainWindow(QMainWindow):
     def send_ping(self):
         """Send PING command for testing"""
         if not self.modem_manager.is_connected():
-            QMessageBox.warning(self, "Not Connected", "Please connect to the modem first.")
+            self._show_warning("Not Connected", "Please connect to the modem first.")
             return
 
         try:
@@ -772,8 +1142,8 @@ class MainWindow(QMainWindow):
                 self.status_bar.showMessage("PING command sent", 3000)
                 logger.info("PING command sent successfully")
             else:
-                QMessageBox.warning(self, "Command Failed", "Failed to send PING command.")
+                self._show_warning("Command Failed", "Failed to send PING command.")
                 logger.error("Failed to send PING command")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error sending PING: {str(e)}")
+            self._show_error("Error", f"Error sending PING: {str(e)}")
             logger.exception("Error sending PING")
\ No newline at end of file
@@ -2,57 +2,237 @@
 Settings dialog for SSDigi Modem
 """
 import os
-import sys
+import time
+import cProfile
 import logging
+from collections import defaultdict
 import sounddevice as sd
-import serial.tools.list_ports
-from PyQt5.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, 
-                         QFormLayout, QLabel, QLineEdit, QPushButton, 
-                         QComboBox, QSpinBox, QCheckBox, QGroupBox, 
-                         QTreeWidget, QTreeWidgetItem, QScrollArea, QWidget, 
+
+try:
+    from serial.tools import list_ports  # Optional: pyserial, only needed for the port scan
+except ImportError:
+    list_ports = None
+
+from PyQt5.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout,
+                         QFormLayout, QLabel, QLineEdit, QPushButton,
+                         QComboBox, QSpinBox, QCheckBox, QGroupBox,
+                         QTreeWidget, QTreeWidgetItem, QScrollArea, QWidget,
                          QMessageBox, QDialogButtonBox, QSlider, QSplitter,
                          QFileDialog)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import (Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker,
+                          pyqtSignal, pyqtSlot)
 from PyQt5.QtGui import QIcon
 from ssdigi_modem.utils.ui_helpers import get_app_icon
-from ssdigi_modem.core.audio_manager import AudioManager
+from ssdigi_modem.core.modems.ardop_modem import ARDOP_BANDWIDTHS
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Static combo box contents, built once at import rather than per dialog
+_SAMPLE_RATES = (8000, 11025, 22050, 44100, 48000)
+_SAMPLE_RATE_LABELS = tuple(f"{rate} Hz" for rate in _SAMPLE_RATES)
+_BANDWIDTH_LABELS = tuple(f"{bw} Hz" for bw in ARDOP_BANDWIDTHS)
+_BAUD_RATES = (4800, 9600, 19200, 38400, 57600, 115200)
+_BAUD_RATE_LABELS = tuple(str(baud) for baud in _BAUD_RATES)
+_PTT_CONTROLS = ("VOX", "RTS", "DTR", "CAT")
+_WATERFALL_SCHEME_LABELS = ("Default", "Viridis", "Hot", "Blue")
+_WATERFALL_SCHEMES = ("default", "viridis", "hot", "blue")  # Values stored in the config
+
+# Repeated Scan clicks within this many seconds reuse the last port list
+_PORT_SCAN_TTL = 2.0
+
+# When set, each open of the dialog is profiled and the stats written to this path
+# on close. Render with `snakeviz settings.prof` or `flameprof settings.prof > settings.svg`
+PROFILE_ENV = "SSDIGI_PROFILE_DIALOG"
+
+
+def _fill_combo(combo, labels, values=None):
+    """Add all labels to a combo in one call, then attach the matching item data"""
+    combo.addItems(labels)
+    if values is not None:
+        for i, value in enumerate(values):
+            combo.setItemData(i, value)
+
+
+def _form_layout():
+    """Create a form layout with a fixed row policy, so rows are never re-wrapped"""
+    layout = QFormLayout()
+    layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
+    return layout
+
+
+def _fixed_width_combo(min_chars):
+    """Create a combo whose size hint does not change as items are added later"""
+    combo = QComboBox()
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(min_chars)
+    return combo
+
+
+# Rig models from the HAMLIB manager, fetched once per session (see _get_rig_models)
+_RIG_MODEL_CACHE = None
+
+
+def _get_rig_models(hamlib_manager):
+    """Return the (model id, name) rig models, asking hamlib_manager only the first time"""
+    global _RIG_MODEL_CACHE
+    if _RIG_MODEL_CACHE is None:
+        _RIG_MODEL_CACHE = tuple(hamlib_manager.get_available_rig_models())
+    return _RIG_MODEL_CACHE
+
+
+# Application icon, decoded once and shared by every dialog instance
+_APP_ICON = None
+
+
+def _get_cached_icon():
+    """Return the application icon, loading it on first use (None if there is none)"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = get_app_icon()
+        if icon_path:
+            _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+
+class AudioDeviceSignals(QObject):
+    """Signals emitted by AudioDeviceWorker"""
+    finished = pyqtSignal(list, list)
+    failed = pyqtSignal(str)
+
+
+class AudioDeviceWorker(QRunnable):
+    """Query PortAudio devices off the GUI thread"""
+
+    def __init__(self):
+        """Initialize worker"""
+        super().__init__()
+        self.signals = AudioDeviceSignals()
+
+    def run(self):
+        """Emit sorted (name, index) lists of input and output devices"""
+        try:
+            input_devices = []
+            output_devices = []
+            for i, device in enumerate(sd.query_devices()):
+                name = device['name']
+                if any(x in name.lower() for x in ['virtual', 'vb-audio']):
+                    continue
+                if device['max_input_channels'] > 0:
+                    input_devices.append((name, i))
+                if device['max_output_channels'] > 0:
+                    output_devices.append((name, i))
+        except Exception as e:
+            logger.error(f"Error querying audio devices: {e}")
+            self.signals.failed.emit(str(e))
+            return
+
+        # Sort devices by name
+        input_devices.sort(key=lambda x: x[0])
+        output_devices.sort(key=lambda x: x[0])
+        self.signals.finished.emit(input_devices, output_devices)
+
+
+class ConfigSaveSignals(QObject):
+    """Signals emitted by ConfigSaveWorker"""
+    finished = pyqtSignal(bool, str)
+
+
+class ConfigSaveWorker(QRunnable):
+    """Write a config snapshot off the GUI thread"""
+
+    def __init__(self, config):
+        """Initialize worker, snapshotting the config on the calling (GUI) thread"""
+        super().__init__()
+        self.config = config
+        self.snapshot = config.snapshot()
+        self.signals = ConfigSaveSignals()
+
+    def run(self):
+        """Save the snapshot and emit whether it succeeded, with any error message"""
+        try:
+            self.config.save_snapshot(self.snapshot)
+            ok, error = True, ""
+        except Exception as e:
+            logger.exception("Error saving settings")
+            ok, error = False, str(e)
+        self.signals.finished.emit(ok, error)
+
+
 class SettingsDialog(QDialog):
     """Settings dialog for SSDigi Modem application"""    
     def __init__(self, config, parent=None):
         """Initialize settings dialog"""
         super().__init__(parent)
+
+        # Optional cProfile of construction and everything up to close (see PROFILE_ENV)
+        self._profiler = None
+        self._start_profile()
+
         self.config = config
         self.initialized = False
+
+        # Resolved once; the dialog is never reparented
+        self._hamlib_manager = getattr(parent, 'hamlib_manager', None)
+        self._on_applied_cb = getattr(parent, 'update_from_config', None)
         self.current_page = None
         self.pages = {}  # Store created setting pages
         
         # Create shared widgets that are used across pages
         self.network_group = None  
+
+        # Pages are built the first time they are shown; each has a loader and an
+        # applier so only built pages are read from and written to the config
+        self._page_builders = {
+            "Audio": self._create_audio_page,
+            "Modem": self._create_modem_page,
+            "ARDOP": self._create_ardop_page,
+            "Station": self._create_station_page,
+            "HAMLIB": self._create_hamlib_page,
+            "Display": self._create_display_page,
+        }
+        self._page_loaders = {
+            "Audio": self._load_audio_settings,
+            "Modem": self._load_modem_settings,
+            "ARDOP": self._load_ardop_settings,
+            "Station": self._load_station_settings,
+            "HAMLIB": self._load_hamlib_settings,
+            "Display": self._load_display_settings,
+        }
+        self._page_appliers = {
+            "Audio": self._apply_audio_settings,
+            "Modem": self._apply_modem_settings,
+            "ARDOP": self._apply_ardop_settings,
+            "Station": self._apply_station_settings,
+            "HAMLIB": self._apply_hamlib_settings,
+            "Display": self._apply_display_settings,
+        }
         
         # Set window properties
         self.setWindowTitle("SSDigi Modem Settings")
         self.setMinimumSize(800, 600)  # More compact size while maintaining usability
         
+        # Background audio device query and config save, if running
+        self._device_worker = None
+        self._save_worker = None
+
+        # Last serial port scan as (time.monotonic() stamp, first device, message text)
+        self._port_scan = None
+
+        # Config revision and widget values as of the last full load, so a reopen
+        # with nothing changed on either side can skip reloading
+        self._loaded_rev = None
+        self._loaded_values = None
+
+        # Message boxes, created on first use and then reused
+        self._info_box = None
+        self._warn_box = None
+
         # Create the UI
         self._create_ui()
         
-        # Schedule initialization for after the event loop starts
-        QTimer.singleShot(100, self._refresh_audio_devices)
-        QTimer.singleShot(200, self._load_settings)    
-        
         # Center window
         self._center_dialog()
-        
-        # Schedule settings initialization
-        def init_settings():
-            self._refresh_audio_devices()
-            self._load_settings()
-            
-        QTimer.singleShot(100, init_settings)
     
     def _center_dialog(self):
         """Center the dialog on screen in a cross-platform compatible way"""
@@ -142,17 +322,13 @@ class SettingsDialog(QDialog):
         self.tree_widget.expandAll()
 
         # Connect tree selection changed
-        self.tree_widget.itemClicked.connect(self._on_tree_item_clicked)    
-        self._create_audio_page()
-        self._create_modem_page()
-        self._create_ardop_page() 
-        self._create_station_page()
-        self._create_hamlib_page()
-        self._create_display_page()# Set up dialog buttons
+        self.tree_widget.itemClicked.connect(self._on_tree_item_clicked)
+
+        # Set up dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Cancel | QDialogButtonBox.Apply)
         button_box.rejected.connect(self.reject)
-        apply_button = button_box.button(QDialogButtonBox.Apply)
-        apply_button.clicked.connect(self._on_apply_clicked)        
+        self.apply_button = button_box.button(QDialogButtonBox.Apply)
+        self.apply_button.clicked.connect(self._on_apply_clicked)        
         main_layout.addWidget(button_box)
 
         # Select first item by default
@@ -165,12 +341,30 @@ class SettingsDialog(QDialog):
 
         # Set application icon
         try:
-            icon_path = get_app_icon()
-            if icon_path:
-                self.setWindowIcon(QIcon(icon_path))
+            icon = _get_cached_icon()
+            if icon:
+                self.setWindowIcon(icon)
         except Exception as e:
             logger.warning(f"Could not set window icon: {e}")
         
+    def _show_info(self, title, text):
+        """Show a modal information message using the reusable information box"""
+        if self._info_box is None:
+            self._info_box = QMessageBox(QMessageBox.Information, "", "", QMessageBox.Ok, self)
+        self._show_message(self._info_box, title, text)
+
+    def _show_warning(self, title, text):
+        """Show a modal warning using the reusable warning box"""
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, "", "", QMessageBox.Ok, self)
+        self._show_message(self._warn_box, title, text)
+
+    def _show_message(self, box, title, text):
+        """Retitle a reusable message box and run it modally"""
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
+
     def _on_tree_item_clicked(self, item):
         """Handle tree item selection"""
         page_name = item.text(0)
@@ -183,13 +377,25 @@ class SettingsDialog(QDialog):
             self.current_page.hide()
             self.settings_layout.removeWidget(self.current_page)
 
-        # Show selected page
-        page = self.pages.get(page_name)
+        # Show selected page, building it on first use
+        page = self._ensure_page(page_name)
         if page:
             self.settings_layout.addWidget(page)
             page.show()
             self.current_page = page
 
+    def _ensure_page(self, name):
+        """Build a page the first time it is needed and load its settings
+
+        Returns:
+            QWidget: The page, or None if there is no page by that name
+        """
+        if name not in self.pages and name in self._page_builders:
+            self._page_builders[name]()
+            if self.initialized:
+                self._load_settings((name,))
+        return self.pages.get(name)
+
     def _create_page(self, name):
         """Create a new page widget"""
         page = QWidget()
@@ -204,24 +410,23 @@ class SettingsDialog(QDialog):
 
         # Audio device selection
         device_group = QGroupBox("Audio Devices")
-        device_layout = QFormLayout()
+        device_layout = _form_layout()
         
         # Create input combo
-        self.input_combo = QComboBox()
+        self.input_combo = _fixed_width_combo(30)
         self.input_combo.setObjectName("input_combo")
         self.input_combo.addItem("System Default", -1)
         device_layout.addRow("Input Device:", self.input_combo)
         
         # Create output combo
-        self.output_combo = QComboBox()
+        self.output_combo = _fixed_width_combo(30)
         self.output_combo.setObjectName("output_combo")
         self.output_combo.addItem("System Default", -1)
         device_layout.addRow("Output Device:", self.output_combo)
 
         # Add the rest of the audio settings
         self.sample_rate_combo = QComboBox()
-        for rate in [8000, 11025, 22050, 44100, 48000]:
-            self.sample_rate_combo.addItem(f"{rate} Hz", rate)
+        _fill_combo(self.sample_rate_combo, _SAMPLE_RATE_LABELS, _SAMPLE_RATES)
         device_layout.addRow("Sample Rate:", self.sample_rate_combo)
 
         self.channels_combo = QComboBox()
@@ -239,23 +444,25 @@ class SettingsDialog(QDialog):
 
         # Audio levels
         levels_group = QGroupBox("Audio Levels")
-        levels_layout = QFormLayout()
+        levels_layout = _form_layout()
 
         self.tx_level_slider = QSlider(Qt.Horizontal)
         self.tx_level_slider.setRange(0, 100)
         self.tx_level_slider.setTickPosition(QSlider.TicksBelow)
         self.tx_level_slider.setTickInterval(10)
-        self.tx_level_label = QLabel("50%")
+        # The number and the fixed "%" are separate labels so a slider step only sets an int
+        self.tx_level_label = QLabel()
+        self.tx_level_label.setNum(50)
 
         tx_level_layout = QHBoxLayout()
         tx_level_layout.addWidget(self.tx_level_slider)
         tx_level_layout.addWidget(self.tx_level_label)
+        tx_level_layout.addWidget(QLabel("%"))
 
         levels_layout.addRow("TX Level:", tx_level_layout)
 
         # Connect slider to label update
-        self.tx_level_slider.valueChanged.connect(
-            lambda v: self.tx_level_label.setText(f"{v}%"))
+        self.tx_level_slider.valueChanged.connect(self._on_tx_level_changed)
 
         levels_group.setLayout(levels_layout)
         layout.addWidget(levels_group)
@@ -268,6 +475,11 @@ class SettingsDialog(QDialog):
         # Add stretch at the end
         layout.addStretch(1)
 
+    @pyqtSlot(int)
+    def _on_tx_level_changed(self, value):
+        """Show the TX level next to the slider"""
+        self.tx_level_label.setNum(value)
+
     def _create_modem_page(self):
         """Create modem settings page"""
         page = self._create_page("Modem")
@@ -277,7 +489,7 @@ class SettingsDialog(QDialog):
 
         # Communication settings
         comm_group = QGroupBox("Communication Settings")
-        comm_layout = QFormLayout()
+        comm_layout = _form_layout()
         comm_layout.setSpacing(8)
 
         # Mode selection
@@ -288,8 +500,7 @@ class SettingsDialog(QDialog):
 
         # Bandwidth selection
         self.bandwidth_combo = QComboBox()
-        for bw in [200, 500, 1000, 2000]:
-            self.bandwidth_combo.addItem(f"{bw} Hz", bw)
+        _fill_combo(self.bandwidth_combo, _BANDWIDTH_LABELS, ARDOP_BANDWIDTHS)
         comm_layout.addRow("Bandwidth:", self.bandwidth_combo)
 
         # Center frequency
@@ -310,7 +521,7 @@ class SettingsDialog(QDialog):
 
         # Basic ARDOP settings group
         basic_group = QGroupBox("ARDOP Mode")
-        basic_layout = QFormLayout()
+        basic_layout = _form_layout()
 
         # Internal/External ARDOP mode
         self.run_ardop_mode_combo = QComboBox()
@@ -320,7 +531,7 @@ class SettingsDialog(QDialog):
         basic_layout.addRow("ARDOP Mode:", self.run_ardop_mode_combo)
 
         # Create network settings group
-        network_layout = QFormLayout()
+        network_layout = _form_layout()
 
         # IP Address
         self.ardop_ip_edit = QLineEdit()
@@ -345,7 +556,7 @@ class SettingsDialog(QDialog):
 
         # ARQ Settings Group
         arq_group = QGroupBox("ARQ Settings")
-        arq_layout = QFormLayout()
+        arq_layout = _form_layout()
 
         # Protocol Mode
         self.protocol_mode_combo = QComboBox()
@@ -366,7 +577,7 @@ class SettingsDialog(QDialog):
 
         # Timing Settings Group
         timing_group = QGroupBox("Timing Settings")
-        timing_layout = QFormLayout()
+        timing_layout = _form_layout()
 
         # Leader length
         self.leader_spin = QSpinBox()
@@ -387,7 +598,7 @@ class SettingsDialog(QDialog):
 
         # Operation Settings Group
         operation_group = QGroupBox("Operation Settings")
-        operation_layout = QFormLayout()
+        operation_layout = _form_layout()
 
         # Basic settings
         self.cwid_check = QCheckBox()
@@ -404,7 +615,7 @@ class SettingsDialog(QDialog):
 
         # Debug Settings Group
         debug_group = QGroupBox("Debug Settings")
-        debug_layout = QFormLayout()
+        debug_layout = _form_layout()
 
         self.debug_log_check = QCheckBox()
         debug_layout.addRow("Debug Log:", self.debug_log_check)
@@ -422,13 +633,13 @@ class SettingsDialog(QDialog):
 
         # Enable HAMLIB
         hamlib_group = QGroupBox("HAMLIB Control")
-        hamlib_layout = QFormLayout()
+        hamlib_layout = _form_layout()
 
         self.hamlib_enabled_check = QCheckBox()
         hamlib_layout.addRow("Enable HAMLIB:", self.hamlib_enabled_check)
 
         # Rig selection
-        self.rig_model_combo = QComboBox()
+        self.rig_model_combo = _fixed_width_combo(20)
         hamlib_layout.addRow("Rig Model:", self.rig_model_combo)
 
         # Serial settings
@@ -441,12 +652,11 @@ class SettingsDialog(QDialog):
         hamlib_layout.addRow("Serial Port:", port_layout)
 
         self.baud_combo = QComboBox()
-        for baud in [4800, 9600, 19200, 38400, 57600, 115200]:
-            self.baud_combo.addItem(str(baud))
+        _fill_combo(self.baud_combo, _BAUD_RATE_LABELS, _BAUD_RATES)
         hamlib_layout.addRow("Baud Rate:", self.baud_combo)
 
         self.ptt_combo = QComboBox()
-        self.ptt_combo.addItems(["VOX", "RTS", "DTR", "CAT"])
+        _fill_combo(self.ptt_combo, _PTT_CONTROLS)
         hamlib_layout.addRow("PTT Control:", self.ptt_combo)
 
         # Add test buttons
@@ -459,6 +669,14 @@ class SettingsDialog(QDialog):
         test_layout.addWidget(ptt_off)
         hamlib_layout.addRow("Test PTT:", test_layout)
 
+        # Successful PTT tests are reported here rather than in a modal box
+        self.ptt_status_label = QLabel("")
+        self._ptt_status_timer = QTimer(self)
+        self._ptt_status_timer.setSingleShot(True)
+        self._ptt_status_timer.setInterval(1500)
+        self._ptt_status_timer.timeout.connect(self.ptt_status_label.clear)
+        hamlib_layout.addRow("", self.ptt_status_label)
+
         hamlib_group.setLayout(hamlib_layout)
         layout.addWidget(hamlib_group)
         layout.addStretch()
@@ -470,10 +688,10 @@ class SettingsDialog(QDialog):
 
         # Waterfall display
         waterfall_group = QGroupBox("Waterfall Display")
-        waterfall_layout = QFormLayout()
+        waterfall_layout = _form_layout()
 
         self.waterfall_combo = QComboBox()
-        self.waterfall_combo.addItems(["Default", "Viridis", "Hot", "Blue"])
+        _fill_combo(self.waterfall_combo, _WATERFALL_SCHEME_LABELS, _WATERFALL_SCHEMES)
         waterfall_layout.addRow("Color Scheme:", self.waterfall_combo)
 
         self.update_rate_spin = QSpinBox()
@@ -486,7 +704,7 @@ class SettingsDialog(QDialog):
 
         # Spectrum display
         spectrum_group = QGroupBox("Spectrum Display")
-        spectrum_layout = QFormLayout()
+        spectrum_layout = _form_layout()
 
         self.show_freq_check = QCheckBox()
         spectrum_layout.addRow("Show Frequency Markers:", self.show_freq_check)
@@ -543,14 +761,14 @@ class SettingsDialog(QDialog):
             self.bandwidth_combo.setCurrentText("500 Hz")
             self.center_freq_spin.setValue(1500)
 
-            QMessageBox.information(self, "Settings Reset", 
-                                  "Modem settings have been reset to defaults.")
+            self._show_info("Settings Reset", 
+                            "Modem settings have been reset to defaults.")
             
             logger.info("Modem settings reset to defaults")
         except Exception as e:
             logger.exception("Error resetting modem settings")
-            QMessageBox.warning(self, "Error", 
-                              f"Failed to reset settings: {str(e)}")
+            self._show_warning("Error", 
+                               f"Failed to reset settings: {str(e)}")
 
     def _reset_ardop_settings(self):
         """Reset ARDOP-specific settings to defaults"""
@@ -570,120 +788,202 @@ class SettingsDialog(QDialog):
             self.use600_check.setChecked(False)         # 600 baud modes off
             self.debug_log_check.setChecked(False)      # Debug log off
 
-            QMessageBox.information(self, "Settings Reset",
-                                  "ARDOP settings have been reset to defaults.")
+            self._show_info("Settings Reset",
+                            "ARDOP settings have been reset to defaults.")
             
             logger.info("ARDOP settings reset to defaults")
 
         except Exception as e:
             logger.exception("Error resetting ARDOP settings")
-            QMessageBox.warning(self, "Error",
-                              "Failed to reset ARDOP settings: {str(e)}")
+            self._show_warning("Error",
+                               f"Failed to reset ARDOP settings: {str(e)}")
 
     def _apply_settings(self):
-        """Apply settings to config"""
+        """Apply settings to config (in memory; see _on_apply_clicked for the save)"""
         try:
-            # Audio settings
-            self.config.set('audio', 'sample_rate', self.sample_rate_combo.currentData())
-            self.config.set('audio', 'channels', self.channels_combo.currentData())
-            self.config.set('audio', 'buffer_size', self.buffer_spin.value())
-            self.config.set('audio', 'input_device', self.input_combo.currentData())
-            self.config.set('audio', 'output_device', self.output_combo.currentData())
-            self.config.set('audio', 'tx_level', self.tx_level_slider.value() / 100.0)            # Modem settings
-            self.config.set('modem', 'mode', self.mode_combo.currentData())
-            self.config.set('modem', 'bandwidth', self.bandwidth_combo.currentData())
-            self.config.set('modem', 'center_freq', self.center_freq_spin.value())     
-            self.config.set('modem', 'ardop_mode', self.run_ardop_mode_combo.currentData())
-            
-            # ARDOP network settings
-            self.config.set('modem', 'ardop_ip', self.ardop_ip_edit.text())
-            self.config.set('modem', 'ardop_port', self.ardop_port_spin.value())
-              
-            for attr, setting in {
-                'protocol_mode_combo': 'protocol_mode',
-                'arq_timeout_spin': 'arq_timeout',
-                'leader_spin': 'leader',
-                'trailer_spin': 'trailer',
-                'cwid_check': 'cwid',
-                'fsk_only_check': 'fskonly',
-                'use600_check': 'use600modes',
-                'debug_log_check': 'debug_log'
-            }.items():
-                if hasattr(self, attr):
-                    value = getattr(self, attr)
-                    if isinstance(value, QCheckBox):
-                        self.config.set('modem', setting, value.isChecked())
-                    elif isinstance(value, (QSpinBox, QComboBox)):
-                        self.config.set('modem', setting, value.value() if isinstance(value, QSpinBox) else value.currentText())
-
-            # HAMLIB settings
-            self.config.set('hamlib', 'enabled', self.hamlib_enabled_check.isChecked())
-            self.config.set('hamlib', 'port', self.port_edit.text())
-            self.config.set('hamlib', 'baud_rate', int(self.baud_combo.currentText()))
-            self.config.set('hamlib', 'ptt_control', self.ptt_combo.currentText())
-
-            # Display settings
-            self.config.set('display', 'waterfall_colors', self.waterfall_combo.currentText())
-            self.config.set('display', 'show_freq_markers', self.show_freq_check.isChecked())
-            self.config.set('display', 'show_grid', self.show_grid_check.isChecked())
-            self.config.set('display', 'update_rate', self.update_rate_spin.value())
-            self.config.set('display', 'fft_average', self.fft_avg_spin.value())
-            self.config.set('display', 'ref_level', self.spectrum_ref_spin.value())
-            self.config.set('display', 'range', self.spectrum_range_spin.value())
-
-            # Station settings
-            self.config.set('station', 'callsign', self.callsign_edit.text().upper())
-            self.config.set('station', 'fullname', self.fullname_edit.text())
-            self.config.set('station', 'email', self.email_edit.text())
-            self.config.set('station', 'city', self.city_edit.text())
-            self.config.set('station', 'grid_square', self.grid_square_edit.text())
-
-            self.config.save()
+            # Pages that were never opened still hold the config values, so skip them.
+            # Values are collected per section and written to the config in one update
+            pending = self._collect_values()
+            self.config.update(pending)
+
+            # The widgets now match the config
+            self._loaded_rev = self.config.revision
+            self._loaded_values = pending
             return True
         except Exception as e:
             logger.exception("Error applying settings")
-            QMessageBox.warning(self, "Error", 
-                              f"Failed to apply settings: {str(e)}")
+            self._show_warning("Error", 
+                               f"Failed to apply settings: {str(e)}")
             return False
 
+    def _collect_values(self):
+        """Read the built pages into a {section: {key: value}} dict"""
+        pending = defaultdict(dict)
+        for name in self.pages:
+            self._page_appliers[name](pending)
+        return pending
+
+    def _apply_audio_settings(self, pending):
+        """Write the Audio page into pending"""
+        pending['audio']['sample_rate'] = self.sample_rate_combo.currentData()
+        pending['audio']['channels'] = self.channels_combo.currentData()
+        pending['audio']['buffer_size'] = self.buffer_spin.value()
+        pending['audio']['input_device'] = self.input_combo.currentData()
+        pending['audio']['output_device'] = self.output_combo.currentData()
+        pending['audio']['tx_level'] = self.tx_level_slider.value() / 100.0
+
+    def _apply_modem_settings(self, pending):
+        """Write the Modem page into pending"""
+        pending['modem']['mode'] = self.mode_combo.currentData()
+        pending['modem']['bandwidth'] = self.bandwidth_combo.currentData()
+        pending['modem']['center_freq'] = self.center_freq_spin.value()
+
+    def _apply_ardop_settings(self, pending):
+        """Write the ARDOP page into pending"""
+        pending['modem']['ardop_mode'] = self.run_ardop_mode_combo.currentData()
+
+        # ARDOP network settings
+        pending['modem']['ardop_ip'] = self.ardop_ip_edit.text()
+        pending['modem']['ardop_port'] = self.ardop_port_spin.value()
+
+        for attr, setting in {
+            'protocol_mode_combo': 'protocol_mode',
+            'arq_timeout_spin': 'arq_timeout',
+            'leader_spin': 'leader',
+            'trailer_spin': 'trailer',
+            'cwid_check': 'cwid',
+            'fsk_only_check': 'fskonly',
+            'use600_check': 'use600modes',
+            'debug_log_check': 'debug_log'
+        }.items():
+            value = getattr(self, attr)
+            if isinstance(value, QCheckBox):
+                pending['modem'][setting] = value.isChecked()
+            elif isinstance(value, (QSpinBox, QComboBox)):
+                pending['modem'][setting] = value.value() if isinstance(value, QSpinBox) else value.currentData()
+
+    def _apply_hamlib_settings(self, pending):
+        """Write the HAMLIB page into pending"""
+        pending['hamlib']['enabled'] = self.hamlib_enabled_check.isChecked()
+        if self.rig_model_combo.count():
+            pending['hamlib']['rig_model'] = self.rig_model_combo.currentData()
+        pending['hamlib']['port'] = self.port_edit.text()
+        pending['hamlib']['baud_rate'] = int(self.baud_combo.currentText())
+        pending['hamlib']['ptt_control'] = self.ptt_combo.currentText()
+
+    def _apply_display_settings(self, pending):
+        """Write the Display page into pending"""
+        pending['display']['waterfall_colors'] = self.waterfall_combo.currentData()
+        pending['display']['show_freq_markers'] = self.show_freq_check.isChecked()
+        pending['display']['show_grid'] = self.show_grid_check.isChecked()
+        pending['display']['update_rate'] = self.update_rate_spin.value()
+        pending['display']['fft_average'] = self.fft_avg_spin.value()
+        pending['display']['ref_level'] = self.spectrum_ref_spin.value()
+        pending['display']['range'] = self.spectrum_range_spin.value()
+
+    def _apply_station_settings(self, pending):
+        """Write the Station page into pending"""
+        pending['station']['callsign'] = self.callsign_edit.text().upper()
+        pending['station']['fullname'] = self.fullname_edit.text()
+        pending['station']['email'] = self.email_edit.text()
+        pending['station']['city'] = self.city_edit.text()
+        pending['station']['grid_square'] = self.grid_square_edit.text()
+
     def _on_apply_clicked(self):
         """Handle Apply button click"""
-        if self._apply_settings():
-            QMessageBox.information(self, "Settings Saved",
-                                  "Settings have been applied successfully.")
+        if self._save_worker is not None or not self._apply_settings():
+            return
+
+        # Let the main window pick up the new values right away
+        if self._on_applied_cb is not None:
+            self._on_applied_cb()
+
+        # Write the file on the thread pool; the result is reported once it is on disk
+        self.apply_button.setEnabled(False)
+        self._save_worker = ConfigSaveWorker(self.config)
+        self._save_worker.signals.finished.connect(self._on_settings_saved, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._save_worker)
+
+    @pyqtSlot(bool, str)
+    def _on_settings_saved(self, ok, error):
+        """Report the result of the background config save"""
+        self._save_worker = None
+        self.apply_button.setEnabled(True)
+        if ok:
+            self._show_info("Settings Saved",
+                            "Settings have been applied successfully.")
+        else:
+            self._show_warning("Error", 
+                               f"Failed to apply settings: {error}")
 
     def _ptt_on(self):
         """Test PTT ON"""
         try:
-            hamlib_manager = self.parent().hamlib_manager if self.parent() else None
+            hamlib_manager = self._hamlib_manager
             if hamlib_manager and hamlib_manager.is_connected():
                 if hamlib_manager.set_ptt(True):
-                    QMessageBox.information(self, "PTT Test", "PTT enabled successfully.")
+                    self._show_ptt_status("PTT enabled")
                 else:
-                    QMessageBox.warning(self, "PTT Test", "Failed to enable PTT.")
+                    self._show_warning("PTT Test", "Failed to enable PTT.")
             else:
-                QMessageBox.warning(self, "PTT Test", "HAMLIB not connected. Please connect first.")
+                self._show_warning("PTT Test", "HAMLIB not connected. Please connect first.")
         except Exception as e:
             logger.exception(f"Error testing PTT: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to test PTT: {str(e)}")
+            self._show_warning("Error", f"Failed to test PTT: {str(e)}")
 
     def _ptt_off(self):
         """Test PTT OFF"""
         try:
-            hamlib_manager = self.parent().hamlib_manager if self.parent() else None
+            hamlib_manager = self._hamlib_manager
             if hamlib_manager and hamlib_manager.is_connected():
                 if hamlib_manager.set_ptt(False):
-                    QMessageBox.information(self, "PTT Test", "PTT disabled successfully.")
+                    self._show_ptt_status("PTT disabled")
                 else:
-                    QMessageBox.warning(self, "PTT Test", "Failed to disable PTT.")
+                    self._show_warning("PTT Test", "Failed to disable PTT.")
             else:
-                QMessageBox.warning(self, "PTT Test", "HAMLIB not connected. Please connect first.")
+                self._show_warning("PTT Test", "HAMLIB not connected. Please connect first.")
         except Exception as e:
             logger.exception(f"Error testing PTT: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to test PTT: {str(e)}")    
+            self._show_warning("Error", f"Failed to test PTT: {str(e)}")
+
+    def _show_ptt_status(self, text):
+        """Show a PTT test result next to the test buttons for a moment"""
+        self.ptt_status_label.setText(text)
+        self._ptt_status_timer.start()
+
+    def _start_profile(self):
+        """Start profiling if PROFILE_ENV is set and no profile is running"""
+        if self._profiler is None and os.environ.get(PROFILE_ENV):
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def done(self, result):
+        """Close the dialog, writing out the profile if one is running"""
+        if self._profiler is not None:
+            self._profiler.disable()
+            path = os.environ.get(PROFILE_ENV)
+            try:
+                self._profiler.dump_stats(path)
+                logger.info(f"Settings dialog profile written to {path}")
+            except OSError as e:
+                logger.error(f"Could not write settings dialog profile: {e}")
+            self._profiler = None
+
+        # Edits left unapplied must be replaced from the config on the next open
+        if self._collect_values() != self._loaded_values:
+            self._loaded_rev = None
+        super().done(result)
+
     def showEvent(self, event):
         """Show event handler - ensure dialog is properly positioned"""
+        self._start_profile()
         super().showEvent(event)
+
+        # The dialog is reused, so reload when the config changed since the last load.
+        # Let it paint first; devices are then enumerated on the thread pool
+        if self.config.revision != self._loaded_rev:
+            QTimer.singleShot(0, self._load_settings)
+        QTimer.singleShot(0, self._refresh_audio_devices)
         
         # Get the screen size and dialog size
         desktop = QApplication.primaryScreen()
@@ -721,15 +1021,15 @@ class SettingsDialog(QDialog):
             self.custom_commands.clear()                  # Clear custom commands
 
             # Optionally, show a message box to inform the user
-            QMessageBox.information(self, "Settings Reset",
-                                    "Modem settings have been reset to defaults.")
+            self._show_info("Settings Reset",
+                            "Modem settings have been reset to defaults.")
 
             logger.info("Modem settings reset to defaults")
 
         except Exception as e:
             logger.exception(f"Error resetting modem settings: {e}")
-            QMessageBox.warning(self, "Error", 
-                              f"Failed to reset modem settings: {str(e)}")
+            self._show_warning("Error", 
+                               f"Failed to reset modem settings: {str(e)}")
 
     def _initialize_settings(self):
         """Initialize settings after UI is fully created"""
@@ -757,7 +1057,7 @@ class SettingsDialog(QDialog):
             
         except Exception as e:
             logger.exception("Error initializing UI")
-            QMessageBox.warning(self, "Error", f"Failed to initialize settings: {str(e)}")
+            self._show_warning("Error", f"Failed to initialize settings: {str(e)}")
 
     def _create_station_page(self):
         """Create station settings page"""
@@ -766,7 +1066,7 @@ class SettingsDialog(QDialog):
         
         # Station details group
         station_group = QGroupBox("Station Details")
-        station_layout = QFormLayout()
+        station_layout = _form_layout()
 
         # Callsign
         self.callsign_edit = QLineEdit()
@@ -800,179 +1100,191 @@ class SettingsDialog(QDialog):
         layout.addStretch(1)    
     
     def _refresh_audio_devices(self):
-        """Refresh available audio devices in a cross-platform compatible way"""
+        """Refresh available audio devices in a cross-platform compatible way
+
+        The PortAudio query can take hundreds of milliseconds, so it runs on the
+        thread pool and the combos are filled when it finishes.
+        """
+        if "Audio" not in self.pages or self._device_worker is not None:
+            return
+
+        self._device_worker = AudioDeviceWorker()
+        self._device_worker.signals.finished.connect(self._on_audio_devices_found, Qt.QueuedConnection)
+        self._device_worker.signals.failed.connect(self._on_audio_devices_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._device_worker)
+
+    @pyqtSlot(list, list)
+    def _on_audio_devices_found(self, input_devices, output_devices):
+        """Fill the device combos with the enumerated devices"""
+        self._device_worker = None
         try:
-            # Store current selections
-            current_input = self.input_combo.currentData() if self.input_combo.currentData() else -1
-            current_output = self.output_combo.currentData() if self.output_combo.currentData() else -1
-
-            # Clear existing items
-            self.input_combo.clear()
-            self.output_combo.clear()
-
-            # Add system default options
-            self.input_combo.addItem("System Default", -1)
-            self.output_combo.addItem("System Default", -1)
-
-            # Add some common device names as placeholders until we can properly detect
-            self.input_combo.addItem("Microphone", 1)
-            self.input_combo.addItem("Line In", 2)
-            self.output_combo.addItem("Speakers", 1)
-            self.output_combo.addItem("Headphones", 2)
-
-            # Try to restore previous selection
-            input_idx = self.input_combo.findData(current_input)
-            if input_idx < 0:
-                input_idx = self.input_combo.findData(self.config.get('audio', 'input_device', -1))
-            if input_idx < 0:
-                input_idx = 0
-            self.input_combo.setCurrentIndex(input_idx)
-
-            output_idx = self.output_combo.findData(current_output)
-            if output_idx < 0:
-                output_idx = self.output_combo.findData(self.config.get('audio', 'output_device', -1))
-            if output_idx < 0:
-                output_idx = 0
-            self.output_combo.setCurrentIndex(output_idx)
-
-            try:
-                
-                # Get input devices
-                input_devices = []
-                for i, device in enumerate(sd.query_devices()):
-                    if device['max_input_channels'] > 0:
-                        name = device['name']
-                        if not any(x in name.lower() for x in ['virtual', 'vb-audio']):
-                            input_devices.append((name, i))
-
-                # Get output devices                
-                output_devices = []
-                for i, device in enumerate(sd.query_devices()):
-                    if device['max_output_channels'] > 0:
-                        name = device['name']
-                        if not any(x in name.lower() for x in ['virtual', 'vb-audio']):
-                            output_devices.append((name, i))
-
-                # Sort devices by name
-                input_devices.sort(key=lambda x: x[0])
-                output_devices.sort(key=lambda x: x[0])
-
-                # Add input devices
-                for name, idx in input_devices:
-                    self.input_combo.addItem(name, idx)
-
-                # Add output devices
-                for name, idx in output_devices:
-                    self.output_combo.addItem(name, idx)
-
-                # Try to restore previous selection
-                input_idx = self.input_combo.findData(current_input)
-                if input_idx < 0:
-                    input_idx = self.input_combo.findData(self.config.get('audio', 'input_device', -1))
-                if input_idx < 0:
-                    input_idx = 0
-                self.input_combo.setCurrentIndex(input_idx)
-
-                output_idx = self.output_combo.findData(current_output)
-                if output_idx < 0:
-                    output_idx = self.output_combo.findData(self.config.get('audio', 'output_device', -1))
-                if output_idx < 0:
-                    output_idx = 0
-                self.output_combo.setCurrentIndex(output_idx)
-
-            except Exception as e:
-                logger.error(f"Error querying audio devices: {e}")
-                # Add placeholder items
-                self.input_combo.addItem("No devices found", -1)
-                self.output_combo.addItem("No devices found", -1)
-
+            self._fill_device_combo(self.input_combo, input_devices, 'input_device')
+            self._fill_device_combo(self.output_combo, output_devices, 'output_device')
         except Exception as e:
             logger.exception("Error refreshing audio devices")
-            QMessageBox.warning(self, "Error",
-                              f"Failed to refresh audio devices: {str(e)}")
+            self._show_warning("Error",
+                               f"Failed to refresh audio devices: {str(e)}")
+
+    @pyqtSlot(str)
+    def _on_audio_devices_failed(self, error):
+        """Show a placeholder entry when the device query fails"""
+        self._device_worker = None
+        for combo in (self.input_combo, self.output_combo):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem("System Default", -1)
+            combo.addItem("No devices found", -1)
+            combo.blockSignals(False)
+
+    def _fill_device_combo(self, combo, devices, config_key):
+        """Replace a device combo's entries, keeping the current or configured selection"""
+        current = combo.currentData()
+        if current is None:
+            current = -1
+
+        # Repopulate silently rather than emitting currentIndexChanged per added device
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItem("System Default", -1)
+            for name, idx in devices:
+                combo.addItem(name, idx)
 
-    def _load_settings(self):
-        """Load settings from config into UI"""
+            # Try to restore previous selection
+            index = combo.findData(current)
+            if index <= 0:
+                index = combo.findData(self.config.get('audio', config_key, -1))
+            combo.setCurrentIndex(max(index, 0))
+        finally:
+            combo.blockSignals(False)
+
+    def _load_settings(self, pages=None):
+        """Load settings from config into UI
+
+        Args:
+            pages: Names of the pages to load (default: every page built so far)
+        """
+        # Fill the widgets with repaints and combo change signals suspended; the
+        # loaders call the handlers that matter once themselves
+        self.setUpdatesEnabled(False)
         try:
-            # Load audio settings
-            self.sample_rate_combo.setCurrentText(f"{self.config.get('audio', 'sample_rate', 48000)} Hz")
-            self.channels_combo.setCurrentIndex(self.config.get('audio', 'channels', 1) - 1)
-            self.buffer_spin.setValue(self.config.get('audio', 'buffer_size', 1024))
-            
-            # Load modem settings
-            tx_level = int(self.config.get('modem', 'tx_level', 0.5) * 100)
-            self.tx_level_slider.setValue(tx_level)
-
-            # Set mode
-            mode = self.config.get('modem', 'mode', 'ARDOP')
-            mode_index = self.mode_combo.findData(mode)
-            if mode_index >= 0:
-                self.mode_combo.setCurrentIndex(mode_index)
-
-            # Load ARDOP mode and network settings
-            ardop_mode = self.config.get('modem', 'ardop_mode', 'internal')
-            mode_index = self.run_ardop_mode_combo.findData(ardop_mode)
-            if mode_index >= 0:
-                self.run_ardop_mode_combo.setCurrentIndex(mode_index)
-                self._on_ardop_mode_changed(mode_index)
-
-            # Load network settings
-            self.ardop_ip_edit.setText(self.config.get('modem', 'ardop_ip', '127.0.0.1'))
-            self.ardop_port_spin.setValue(self.config.get('modem', 'ardop_port', 8515))
-
-            # Set bandwidth
-            bw = self.config.get('modem', 'bandwidth', 500)
-            bw_index = self.bandwidth_combo.findData(bw)
-            if bw_index >= 0:
-                self.bandwidth_combo.setCurrentIndex(bw_index)
-
-            # Set center frequency
-            self.center_freq_spin.setValue(self.config.get('modem', 'center_freq', 1500))
-
-            # Load ARDOP protocol settings
-            if hasattr(self, 'protocol_mode_combo'):
-                self.protocol_mode_combo.setCurrentText(self.config.get('modem', 'protocol_mode', 'ARQ'))
-            if hasattr(self, 'arq_timeout_spin'):
-                self.arq_timeout_spin.setValue(self.config.get('modem', 'arq_timeout', 120))
-            if hasattr(self, 'leader_spin'):
-                self.leader_spin.setValue(self.config.get('modem', 'leader', 120))
-            if hasattr(self, 'trailer_spin'):
-                self.trailer_spin.setValue(self.config.get('modem', 'trailer', 0))
-            if hasattr(self, 'cwid_check'):
-                self.cwid_check.setChecked(self.config.get('modem', 'cwid', False))
-            if hasattr(self, 'fsk_only_check'):
-                self.fsk_only_check.setChecked(self.config.get('modem', 'fskonly', False))
-            if hasattr(self, 'use600_check'):
-                self.use600_check.setChecked(self.config.get('modem', 'use600modes', False))
-            if hasattr(self, 'debug_log_check'):
-                self.debug_log_check.setChecked(self.config.get('modem', 'debug_log', False))
-
-            # HAMLIB settings
-            self.hamlib_enabled_check.setChecked(self.config.get('hamlib', 'enabled', False))
-            self.port_edit.setText(self.config.get('hamlib', 'port', ''))
-            self.baud_combo.setCurrentText(str(self.config.get('hamlib', 'baud_rate', 9600)))
-            self.ptt_combo.setCurrentText(self.config.get('hamlib', 'ptt_control', 'CAT'))
-
-            # Display settings
-            self.waterfall_combo.setCurrentText(self.config.get('display', 'waterfall_colors', 'Default'))
-            self.show_freq_check.setChecked(self.config.get('display', 'show_freq_markers', True))
-            self.show_grid_check.setChecked(self.config.get('display', 'show_grid', True))
-            self.update_rate_spin.setValue(self.config.get('display', 'update_rate', 10))
-            self.fft_avg_spin.setValue(self.config.get('display', 'fft_average', 2))
-            self.spectrum_ref_spin.setValue(self.config.get('display', 'ref_level', -60))
-            self.spectrum_range_spin.setValue(self.config.get('display', 'range', 70))
-
-            # Station settings
-            self.callsign_edit.setText(self.config.get('station', 'callsign', '').upper())
-            self.fullname_edit.setText(self.config.get('station', 'fullname', ''))
-            self.email_edit.setText(self.config.get('station', 'email', ''))
-            self.city_edit.setText(self.config.get('station', 'city', ''))
-            self.grid_square_edit.setText(self.config.get('station', 'grid_square', ''))
+            for name in list(self.pages) if pages is None else pages:
+                blockers = [QSignalBlocker(combo) for combo in self.pages[name].findChildren(QComboBox)]
+                try:
+                    self._page_loaders[name]()
+                finally:
+                    for blocker in blockers:
+                        blocker.unblock()
+            self.initialized = True
+
+            if pages is None:
+                self._loaded_rev = self.config.revision
+            self._loaded_values = self._collect_values()
 
         except Exception as e:
             logger.exception("Error loading settings")
-            QMessageBox.warning(self, "Error", 
-                              f"Failed to load settings: {str(e)}")
+            self._show_warning("Error", 
+                               f"Failed to load settings: {str(e)}")
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _select_data(self, combo, value):
+        """Select the combo entry whose item data equals value, if there is one"""
+        index = combo.findData(value)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+
+    def _load_audio_settings(self):
+        """Fill the Audio page from config"""
+        audio_cfg = self.config.get('audio')
+        modem_cfg = self.config.get('modem')
+        self._select_data(self.sample_rate_combo, audio_cfg.get('sample_rate', 48000))
+        self._select_data(self.channels_combo, audio_cfg.get('channels', 1))
+        self.buffer_spin.setValue(audio_cfg.get('buffer_size', 1024))
+
+        tx_level = int(modem_cfg.get('tx_level', 0.5) * 100)
+        self.tx_level_slider.setValue(tx_level)
+
+    def _load_modem_settings(self):
+        """Fill the Modem page from config"""
+        modem_cfg = self.config.get('modem')
+
+        # Set mode
+        mode = modem_cfg.get('mode', 'ARDOP')
+        mode_index = self.mode_combo.findData(mode)
+        if mode_index >= 0:
+            self.mode_combo.setCurrentIndex(mode_index)
+        self._on_mode_changed()
+
+        # Set bandwidth
+        bw = modem_cfg.get('bandwidth', 500)
+        bw_index = self.bandwidth_combo.findData(bw)
+        if bw_index >= 0:
+            self.bandwidth_combo.setCurrentIndex(bw_index)
+
+        # Set center frequency
+        self.center_freq_spin.setValue(modem_cfg.get('center_freq', 1500))
+
+    def _load_ardop_settings(self):
+        """Fill the ARDOP page from config"""
+        modem_cfg = self.config.get('modem')
+
+        # Load ARDOP mode and network settings
+        ardop_mode = modem_cfg.get('ardop_mode', 'internal')
+        mode_index = self.run_ardop_mode_combo.findData(ardop_mode)
+        if mode_index >= 0:
+            self.run_ardop_mode_combo.setCurrentIndex(mode_index)
+        self._on_ardop_mode_changed(self.run_ardop_mode_combo.currentIndex())
+
+        # Load network settings
+        self.ardop_ip_edit.setText(modem_cfg.get('ardop_ip', '127.0.0.1'))
+        self.ardop_port_spin.setValue(modem_cfg.get('ardop_port', 8515))
+
+        # Load ARDOP protocol settings
+        self._select_data(self.protocol_mode_combo, modem_cfg.get('protocol_mode', 'ARQ'))
+        self.arq_timeout_spin.setValue(modem_cfg.get('arq_timeout', 120))
+        self.leader_spin.setValue(modem_cfg.get('leader', 120))
+        self.trailer_spin.setValue(modem_cfg.get('trailer', 0))
+        self.cwid_check.setChecked(modem_cfg.get('cwid', False))
+        self.fsk_only_check.setChecked(modem_cfg.get('fskonly', False))
+        self.use600_check.setChecked(modem_cfg.get('use600modes', False))
+        self.debug_log_check.setChecked(modem_cfg.get('debug_log', False))
+
+    def _load_hamlib_settings(self):
+        """Fill the HAMLIB page from config"""
+        hamlib_cfg = self.config.get('hamlib')
+        self.hamlib_enabled_check.setChecked(hamlib_cfg.get('enabled', False))
+
+        # The rig list does not change during a session, so the combo is filled only once
+        if not self.rig_model_combo.count() and self._hamlib_manager is not None:
+            rig_models = _get_rig_models(self._hamlib_manager)
+            _fill_combo(self.rig_model_combo, [name for _, name in rig_models], [model for model, _ in rig_models])
+        self._select_data(self.rig_model_combo, hamlib_cfg.get('rig_model', 1))
+
+        self.port_edit.setText(hamlib_cfg.get('port', ''))
+        self._select_data(self.baud_combo, hamlib_cfg.get('baud_rate', 9600))
+        self.ptt_combo.setCurrentText(hamlib_cfg.get('ptt_control', 'CAT'))
+
+    def _load_display_settings(self):
+        """Fill the Display page from config"""
+        display_cfg = self.config.get('display')
+        # Older configs stored the display text ("Default"), so match the id case-insensitively
+        self._select_data(self.waterfall_combo, display_cfg.get('waterfall_colors', 'default').lower())
+        self.show_freq_check.setChecked(display_cfg.get('show_freq_markers', True))
+        self.show_grid_check.setChecked(display_cfg.get('show_grid', True))
+        self.update_rate_spin.setValue(display_cfg.get('update_rate', 10))
+        self.fft_avg_spin.setValue(display_cfg.get('fft_average', 2))
+        self.spectrum_ref_spin.setValue(display_cfg.get('ref_level', -60))
+        self.spectrum_range_spin.setValue(display_cfg.get('range', 70))
+
+    def _load_station_settings(self):
+        """Fill the Station page from config"""
+        station_cfg = self.config.get('station')
+        self.callsign_edit.setText(station_cfg.get('callsign', '').upper())
+        self.fullname_edit.setText(station_cfg.get('fullname', ''))
+        self.email_edit.setText(station_cfg.get('email', ''))
+        self.city_edit.setText(station_cfg.get('city', ''))
+        self.grid_square_edit.setText(station_cfg.get('grid_square', ''))
 
     def _browse_log_dir(self):
         """Browse for log directory"""
@@ -988,25 +1300,32 @@ class SettingsDialog(QDialog):
                 self.log_dir_edit.setText(directory)
         except Exception as e:
             logger.exception("Error browsing for log directory")
-            QMessageBox.warning(self, "Error",
-                              f"Failed to browse for directory: {str(e)}")
+            self._show_warning("Error",
+                               f"Failed to browse for directory: {str(e)}")
 
     def _scan_serial_ports(self):
         """Scan for available serial ports"""
+        if list_ports is None:
+            self._show_warning("No Ports",
+                               "Serial port scanning requires the pyserial package")
+            return
+
         try:
-            ports = []
-            for port in serial.tools.list_ports.comports():
-                ports.append(port.device)
+            now = time.monotonic()
+            if self._port_scan is None or now - self._port_scan[0] >= _PORT_SCAN_TTL:
+                ports = list_ports.comports()
+                # The message text is built once per scan and reused with the cached result
+                port_text = "Found ports:\n" + "\n".join(f"{port.device} - {port.description}" for port in ports)
+                self._port_scan = (now, ports[0].device if ports else None, port_text)
+            _, first_port, port_text = self._port_scan
             
-            if ports:
-                self.port_edit.setText(ports[0])  # Set first port as default
-                port_list = "\n".join(ports)
-                QMessageBox.information(self, "Available Ports", 
-                                      f"Found ports:\n{port_list}")
+            if first_port:
+                self.port_edit.setText(first_port)  # Set first port as default
+                self._show_info("Available Ports", port_text)
             else:
-                QMessageBox.warning(self, "No Ports", 
-                                  "No serial ports found")
+                self._show_warning("No Ports", 
+                                   "No serial ports found")
         except Exception as e:
             logger.exception("Error scanning serial ports")
-            QMessageBox.warning(self, "Error",
-                              f"Failed to scan serial ports: {str(e)}")
+            self._show_warning("Error",
+                               f"Failed to scan serial ports: {str(e)}")
@@ -4,11 +4,21 @@ Spectrum visualization for SSDigi Modem
 import numpy as np
 import logging
 from PyQt5.QtWidgets import QWidget, QSizePolicy
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
-from PyQt5.QtCore import Qt, QRect, QSize, pyqtSignal, QPoint
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF, QPixmap
+from PyQt5.QtCore import Qt, QRect, QSize, pyqtSignal, QPoint, QPointF
 
 logger = logging.getLogger(__name__)
 
+
+def _numpy_polygon(points):
+    """Create a QPolygonF and a writable (points, 2) float64 view of its storage"""
+    poly = QPolygonF()
+    poly.fill(QPointF(), points)
+    buf = poly.data()
+    buf.setsize(points * 2 * 8)
+    return poly, np.frombuffer(buf, dtype=np.float64).reshape(points, 2)
+
+
 class SpectrumView(QWidget):
     """Widget that displays FFT spectrum data"""
     # Signal emitted when user clicks on a frequency
@@ -42,6 +52,15 @@ class SpectrumView(QWidget):
         # Selection marker
         self.selected_freq = None
 
+        # Spectrum polygons, reallocated only when the point count changes
+        self._poly_points = 0
+        self._xs_key = None
+        self._fill_brush = QBrush(QColor(50, 200, 50, 80))
+
+        # Background, grid and labels, re-rendered only when their inputs change
+        self._chrome_cache = None
+        self._chrome_key = None
+
         # Enable mouse tracking
         self.setMouseTracking(True)
 
@@ -62,6 +81,7 @@ class SpectrumView(QWidget):
         # Resize data array if needed
         if len(self.data) != self.fft_size // 2:
             self.data = np.zeros(self.fft_size // 2)
+        self._chrome_key = None
 
         # Update and redraw
         self.update()
@@ -139,15 +159,14 @@ class SpectrumView(QWidget):
         # Get drawing rect
         rect = self.rect()
 
-        # Draw background
-        painter.fillRect(rect, self.bg_color)
-
         # Check if we have valid data
         if len(self.data) < 2:
+            painter.fillRect(rect, self.bg_color)
             return
 
         # Limit frequency range to center_freq * 2 if setting is enabled
-        limit_freq = self.config.get('ui', 'limit_freq_range', True)
+        ui_cfg = self.config.get('ui')
+        limit_freq = ui_cfg.get('limit_freq_range', True)
         if limit_freq:
             # Calculate how many samples correspond to center_freq * 2
             max_freq = self.center_freq * 2
@@ -158,21 +177,25 @@ class SpectrumView(QWidget):
             max_bin_index = len(self.data) - 1
 
         # Get reference level and display range from config
-        ref_level = self.config.get('ui', 'spectrum_ref_level', -60)
-        display_range = self.config.get('ui', 'spectrum_range', 70)
+        ref_level = ui_cfg.get('spectrum_ref_level', -60)
+        display_range = ui_cfg.get('spectrum_range', 70)
         self.max_value = ref_level
         self.min_value = ref_level - display_range
 
-        # Define the plotting area, leaving space for labels
-        self.plot_rect = QRect(
-            rect.left() + 40,           # Left margin for labels
-            rect.top() + 20,            # Top margin for labels
-            rect.width() - 50,          # Right margin for labels
-            rect.height() - 30          # Bottom margin for labels
-        )
-
-        # Draw grid
-        self._draw_grid(painter, rect, max_bin_index)
+        # The trace, bandwidth lines, marker and click mapping share the grid's plot
+        # area; _draw_grid used to overwrite the rect set here with this same one
+        self.plot_rect = self._plot_rect(rect)
+
+        # Background, grid and labels only change with size, range and display
+        # settings, so they are rendered once into a pixmap and blitted each frame
+        dpr = self.devicePixelRatioF()
+        chrome_key = (rect.width(), rect.height(), dpr, self.min_value, self.max_value,
+                      self.bandwidth, self.freq_display_multiplier,
+                      ui_cfg.get('show_grid', True), ui_cfg.get('show_freq_markers', True))
+        if self._chrome_key != chrome_key:
+            self._render_chrome(rect, dpr)
+            self._chrome_key = chrome_key
+        painter.drawPixmap(0, 0, self._chrome_cache)
 
         # Draw spectrum line
         self._draw_spectrum(painter, rect, max_bin_index)
@@ -186,21 +209,35 @@ class SpectrumView(QWidget):
 
         painter.end()
 
-    def _draw_grid(self, painter, rect, max_bin_index):
-        """Draw grid lines and frequency labels"""
-        show_grid = self.config.get('ui', 'show_grid', True)
-        show_freq_markers = self.config.get('ui', 'show_freq_markers', True)
-
+    def _plot_rect(self, rect):
+        """Return the plotting area inside rect, leaving margins for the labels"""
         # Create margin to prevent text cutoff
         left_margin = 40  # Space for dB labels
         bottom_margin = 20  # Space for frequency labels
-        plot_rect = QRect(
+        return QRect(
             rect.left() + left_margin,
             rect.top() + 5,
             rect.width() - left_margin - 5,
             rect.height() - bottom_margin - 5
         )
 
+    def _render_chrome(self, rect, dpr):
+        """Render the background, grid and labels into the cached chrome pixmap"""
+        self._chrome_cache = QPixmap(rect.size() * dpr)
+        self._chrome_cache.setDevicePixelRatio(dpr)
+        painter = QPainter(self._chrome_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(rect, self.bg_color)
+        self._draw_grid(painter, rect)
+        painter.end()
+
+    def _draw_grid(self, painter, rect):
+        """Draw grid lines and frequency labels"""
+        show_grid = self.config.get('ui', 'show_grid', True)
+        show_freq_markers = self.config.get('ui', 'show_freq_markers', True)
+        left_margin = 40  # Space for dB labels
+        plot_rect = self._plot_rect(rect)
+
         # Set grid pen
         grid_pen = QPen(self.grid_color)
         grid_pen.setStyle(Qt.DotLine)
@@ -251,9 +288,6 @@ class SpectrumView(QWidget):
                 painter.drawText(x - text_width // 2, rect.bottom() - 5, freq_text)
                 painter.setPen(grid_pen)
 
-        # Store plot_rect for other drawing methods
-        self.plot_rect = plot_rect
-
     def _freq_to_x(self, freq, rect):
         """Convert frequency to x coordinate"""
         # Calculate max frequency based on the multiplier
@@ -290,34 +324,59 @@ class SpectrumView(QWidget):
         spectrum_pen.setWidth(2)
         painter.setPen(spectrum_pen)
 
-        # Use QPainterPath for smoother line
-        path = QPainterPath()
-
-        # Start at the left edge
-        first_x = self.plot_rect.left()
-        first_y = self._data_to_y(self.data[0], rect)
-        path.moveTo(first_x, first_y)
-
-        # Add points to the path
-        for i in range(1, max_bin_index + 1):
-            x = self.plot_rect.left() + i * self.plot_rect.width() / max_bin_index
-            y = self._data_to_y(self.data[i], rect)
-            path.lineTo(x, y)
-
-        # Draw the path
-        painter.drawPath(path)
-
-        # Fill area under the graph with gradient
-        gradient_brush = QBrush(QColor(50, 200, 50, 80))
-        painter.fillPath(self._create_fill_path(path, rect), gradient_brush)
-
-    def _create_fill_path(self, path, rect):
-        """Create a path for filling under the spectrum curve"""
-        fill_path = QPainterPath(path)
-        fill_path.lineTo(rect.right(), rect.bottom())
-        fill_path.lineTo(rect.left(), rect.bottom())
-        fill_path.closeSubpath()
-        return fill_path
+        # Bins 0..max_bin_index spread evenly across the plot area; with more than
+        # two bins per pixel column, draw one min/max pair per column instead
+        bins = max_bin_index + 1
+        plot_rect = self.plot_rect
+        columns = plot_rect.width()
+        decimate = bins > 2 * columns
+        points = 2 * columns if decimate else bins
+        line_xy = self._spectrum_polygons(points)
+        xs_key = (bins, plot_rect.left(), plot_rect.width())
+        if self._xs_key != xs_key:
+            xs = np.linspace(plot_rect.left(), plot_rect.left() + plot_rect.width(), bins)
+            if decimate:
+                self._column_starts = np.arange(columns) * bins // columns
+                xs = np.repeat(xs[self._column_starts], 2)
+            line_xy[:, 0] = xs
+            self._xs_key = xs_key
+
+        # Map dB values to y coordinates in place, same as _data_to_y
+        ys = line_xy[:, 1]
+        if decimate:
+            np.minimum.reduceat(self.data[:bins], self._column_starts, out=ys[0::2])
+            np.maximum.reduceat(self.data[:bins], self._column_starts, out=ys[1::2])
+            np.clip(ys, self.min_value, self.max_value, out=ys)
+        else:
+            np.clip(self.data[:bins], self.min_value, self.max_value, out=ys)
+        ys -= self.min_value
+        ys *= plot_rect.height() / (self.max_value - self.min_value)
+        np.subtract(plot_rect.bottom(), ys, out=ys)
+
+        # Draw the line
+        painter.drawPolyline(self._line_poly)
+
+        # Fill area under the graph, closed along the bottom of the widget
+        self._fill_xy[:points] = line_xy
+        self._fill_xy[points] = (rect.right(), rect.bottom())
+        self._fill_xy[points + 1] = (rect.left(), rect.bottom())
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._fill_brush)
+        painter.drawPolygon(self._fill_poly)
+        painter.setBrush(Qt.NoBrush)
+
+    def _spectrum_polygons(self, points):
+        """Return the numpy view of the spectrum line, reallocating the polygons if needed
+
+        The line polygon holds the spectrum points; the fill polygon holds the
+        same points plus two closing corners along the bottom edge.
+        """
+        if self._poly_points != points:
+            self._line_poly, self._line_xy = _numpy_polygon(points)
+            self._fill_poly, self._fill_xy = _numpy_polygon(points + 2)
+            self._poly_points = points
+            self._xs_key = None
+        return self._line_xy
 
     def _draw_frequency_marker(self, painter, rect):
         """Draw frequency marker at selected frequency"""
@@ -4,10 +4,39 @@ Waterfall visualization widget for SSDigi Modem
 import numpy as np
 from PyQt5.QtWidgets import QWidget, QSizePolicy
 from PyQt5.QtGui import QPainter, QImage, QColor, QPen
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QRect, QPoint, QObject, QThread, pyqtSignal, pyqtSlot
+
+from ssdigi_modem.ui.colormap_kernels import map_row
+
+
+class WaterfallRowWorker(QObject):
+    """Colors waterfall rows on a worker thread"""
+    rowReady = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        # (bin_idx, bin_weight, min_value, max_value, lut, bg), replaced as a whole
+        # by the view so a frame never sees a half-updated mapping
+        self.params = None
+
+    @pyqtSlot(object)
+    def on_fft(self, fft_data):
+        """Map one FFT frame (None for a blank row) to a colored row and hand it back to the view"""
+        bin_idx, bin_weight, min_value, max_value, lut, bg = self.params
+        row = np.empty(len(bin_idx), dtype=np.uint32)
+        if fft_data is None:
+            row.fill(bg)
+        else:
+            map_row(fft_data, bin_idx, bin_weight, min_value, max_value, lut, bg, row)
+        self.rowReady.emit(row)
+
 
 class WaterfallView(QWidget):
     """Widget that displays a scrolling waterfall (spectrogram) of FFT data."""
+
+    # Frames handed to the row worker's thread
+    fftQueued = pyqtSignal(object)
+
     def __init__(self, config, parent=None):
         super().__init__(parent)
         # Store reference to config
@@ -32,21 +61,45 @@ class WaterfallView(QWidget):
 
         # Waterfall settings
         self.bg_color = QColor(20, 20, 30)
+        self._bg_rgb = self.bg_color.rgb()
+        self._bandwidth_pen = QPen(QColor(255, 150, 0, 180))  # Orange with some transparency
+        self._bandwidth_pen.setWidth(1)
+        self._bandwidth_pen.setStyle(Qt.DashLine)
         self.buffer_height = 200
         # Reduce buffer width by left margin to maintain total width
         self.total_width = 395 # Total desired width
         self.buffer_width = self.total_width - self.left_margin  # Actual display area width
 
-        # Create the image with the total width
-        self.waterfall_image = QImage(self.total_width, self.buffer_height, QImage.Format_RGB32)
-        self.waterfall_image.fill(self.bg_color)
-        self._colormap = self._create_colormap()
+        # Create the row ring and its image with the total width
+        self._allocate_buffer()
+        self._lut = self._create_colormap()
         self.setMinimumSize(self.total_width, self.buffer_height)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
+        # Rows are colored off the GUI thread; the view only copies them into the ring
+        self._row_thread = QThread(self)
+        self._row_worker = WaterfallRowWorker()
+        self._row_worker.moveToThread(self._row_thread)
+        self._row_thread.finished.connect(self._row_worker.deleteLater)
+        self.fftQueued.connect(self._row_worker.on_fft, Qt.QueuedConnection)
+        self._row_worker.rowReady.connect(self._add_row, Qt.QueuedConnection)
+        self._row_thread.start()
+
         # Calculate frequency mapping
         self._calculate_freq_mapping()
 
+    def _allocate_buffer(self):
+        """Allocate the waterfall row ring and the QImage that wraps it
+
+        Rows are written in place at _head, the oldest row, so adding a row never
+        copies the rest of the image; paintEvent draws the ring in two parts.
+        Only the data span of a row is ever rewritten, the margins stay background.
+        """
+        self._rows = np.full((self.buffer_height, self.total_width), self._bg_rgb, dtype=np.uint32)
+        self._head = 0
+        self.waterfall_image = QImage(self._rows.data, self.total_width, self.buffer_height,
+                                      self.total_width * 4, QImage.Format_RGB32)
+
     def _calculate_freq_mapping(self):
         """Calculate the mapping between FFT bins and display pixels."""
         # Calculate expanded frequency range based on multiplier
@@ -54,6 +107,13 @@ class WaterfallView(QWidget):
         self.start_freq = self.center_freq - (display_bandwidth / 2)
         self.end_freq = self.center_freq + (display_bandwidth / 2)
 
+        # Bandwidth limit lines as a fraction of the display width, converted to
+        # pixel positions on the full image (including the left margin)
+        lower_percent = (self.center_freq - self.bandwidth / 2 - self.start_freq) / display_bandwidth
+        upper_percent = (self.center_freq + self.bandwidth / 2 - self.start_freq) / display_bandwidth
+        self._bandwidth_pixels = (int(lower_percent * self.buffer_width) + self.left_margin,
+                                  int(upper_percent * self.buffer_width) + self.left_margin)
+
         # Frequency per bin
         bin_freq = self.sample_rate / self.fft_size
 
@@ -109,47 +169,47 @@ class WaterfallView(QWidget):
             if bin_ceil < self.fft_size // 2 - 1 and len(self.pixel_to_bins[pixel_x]) < 4:
                 self.pixel_to_bins[pixel_x].append((bin_ceil + 1, weight_ceil * 0.3))
 
+        self._pack_pixel_bins()
+
+    def _pack_pixel_bins(self):
+        """Pack pixel_to_bins into (buffer_width, 4) index and weight arrays
+
+        Unused slots get weight 0, so update_waterfall can interpolate a whole
+        row with one gather and a weighted sum.
+        """
+        self._bin_idx = np.zeros((self.buffer_width, 4), dtype=np.intp)
+        self._bin_weight = np.zeros((self.buffer_width, 4), dtype=np.float64)
+        for pixel_x, weighted_bins in self.pixel_to_bins.items():
+            for slot, (bin_idx, weight) in enumerate(weighted_bins[:4]):
+                self._bin_idx[pixel_x, slot] = bin_idx
+                self._bin_weight[pixel_x, slot] = weight
+
+        self._row_worker.params = (self._bin_idx, self._bin_weight, float(self.min_value),
+                                   float(self.max_value), self._lut, self._bg_rgb)
+
     def _create_colormap(self):
-        """Create an enhanced colormap with better signal visualization."""
-        colormap = []
-        for i in range(256):
-            normalized = i / 255.0
-            if normalized < 0.25:  # Dark blue to blue
-                r = 0
-                g = int(normalized * 4 * 150)
-                b = int(50 + normalized * 4 * 205)
-            elif normalized < 0.5:  # Blue to cyan
-                r = 0
-                g = int(150 + (normalized - 0.25) * 4 * 105)
-                b = 255
-            elif normalized < 0.75:  # Cyan to yellow
-                r = int((normalized - 0.5) * 4 * 255)
-                g = 255
-                b = int(255 - (normalized - 0.5) * 4 * 255)
-            else:  # Yellow to red
-                r = 255
-                g = int(255 - (normalized - 0.75) * 4 * 255)
-                b = 0
-            colormap.append(QColor(r, g, b).rgb())
-        return colormap
+        """Create an enhanced colormap as a 256-entry lookup table of packed RGB32 values."""
+        normalized = np.arange(256) / 255.0
+        bands = [normalized < 0.25, normalized < 0.5, normalized < 0.75]
+        # Dark blue to blue, blue to cyan, cyan to yellow, yellow to red
+        r = np.select(bands, [0, 0, (normalized - 0.5) * 4 * 255], 255)
+        g = np.select(bands, [normalized * 4 * 150, 150 + (normalized - 0.25) * 4 * 105, 255],
+                      255 - (normalized - 0.75) * 4 * 255)
+        b = np.select(bands, [50 + normalized * 4 * 205, 255, 255 - (normalized - 0.5) * 4 * 255], 0)
+        r, g, b = (c.astype(np.uint32) for c in (r, g, b))
+        return np.uint32(0xFF000000) | (r << 16) | (g << 8) | b
 
     def update_waterfall(self, fft_data):
-        """Update the waterfall with a new row of FFT data (expects dB values)."""
-        # Manually scroll image up by 1 row
-        scrolled = self.waterfall_image.copy(0, 1, self.total_width, self.buffer_height - 1)
-        self.waterfall_image.fill(self.bg_color)
-        # Paste the scrolled image back (shifted up by 1)
-        painter = QPainter(self.waterfall_image)
-        painter.drawImage(0, 0, scrolled)
-        painter.end()
-
+        """Queue a new row of FFT data (expects dB values) for the row worker."""
         # Ensure fft_data isn't empty or invalid
         if fft_data is None or len(fft_data) == 0:
+            self.fftQueued.emit(None)  # Blank row, queued behind earlier frames
             return
 
         # Ensure we have enough FFT data for our frequency range
         if len(fft_data) < self.end_bin:
             print(f"Warning: FFT data length {len(fft_data)} is less than required end bin {self.end_bin}")
+            self.fftQueued.emit(None)  # Blank row, queued behind earlier frames
             return
 
         # Special handling for the 2000 Hz bandwidth case
@@ -159,76 +219,42 @@ class WaterfallView(QWidget):
             self.start_bin = max(0, min(60, len(fft_data) - 100))  # Empirically chosen safe values
             self.end_bin = min(len(fft_data) - 1, self.start_bin + 100)
 
-        # Map FFT data to color indices
-        fft_data = np.clip(fft_data, self.min_value, self.max_value)
-        value_range = self.max_value - self.min_value# Process data for the last row with improved interpolation
-        for pixel_x in range(self.buffer_width):
-            # Default to background color
-            color = self.bg_color.rgb()
-
-            if pixel_x in self.pixel_to_bins and self.pixel_to_bins[pixel_x]:
-                # Get the weighted bins that contribute to this pixel
-                weighted_bins = self.pixel_to_bins[pixel_x]
-
-                # Apply weighted interpolation
-                total_value = 0.0
-                total_weight = 0.0
-
-                for bin_idx, weight in weighted_bins:
-                    try:
-                        if 0 <= bin_idx < len(fft_data):
-                            # Use weighted contribution from each bin
-                            total_value += fft_data[bin_idx] * weight
-                            total_weight += weight
-                    except Exception as e:
-                        print(f"Error at bin {bin_idx}/{len(fft_data)}: {e}")
-
-                if total_weight > 0:
-                    # Calculate weighted average
-                    value = total_value / total_weight
-
-                    # Convert to color
-                    normalized = (value - self.min_value) / value_range
-                    normalized = max(0.0, min(0.98, normalized))
-                    color_idx = int(normalized * 255)
-                    color = self._colormap[color_idx]
-
-            # Set the pixel in the last row - offset by left margin
-            self.waterfall_image.setPixel(pixel_x + self.left_margin, self.buffer_height - 1, color)
+        # The caller reuses its FFT buffer every frame, so the worker gets its own copy
+        self.fftQueued.emit(np.array(fft_data, dtype=np.float32))
 
+    @pyqtSlot(object)
+    def _add_row(self, row):
+        """Copy a row colored by the worker into the ring and repaint"""
+        if len(row) != self.buffer_width:
+            return  # Colored before the last resize
+        self._next_row()[:] = row
         self.update()
 
+    def _next_row(self):
+        """Claim the data span of the oldest row in the ring as the new bottom row"""
+        row = self._rows[self._head, self.left_margin:self.left_margin + self.buffer_width]
+        self._head = (self._head + 1) % self.buffer_height
+        return row
+
+    def stop_worker(self):
+        """Stop the row worker thread, waiting for any frame in progress"""
+        self._row_thread.quit()
+        self._row_thread.wait()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.fillRect(self.rect(), self.bg_color)
 
-        # Draw the waterfall - no need to shift since the image already includes the margin
-        painter.drawImage(0, 0, self.waterfall_image)
+        # Draw the waterfall ring oldest row first - no need to shift since the image
+        # already includes the margin
+        older = self.buffer_height - self._head
+        painter.drawImage(QPoint(0, 0), self.waterfall_image, QRect(0, self._head, self.total_width, older))
+        if self._head:
+            painter.drawImage(QPoint(0, older), self.waterfall_image, QRect(0, 0, self.total_width, self._head))
 
-        # Calculate the actual bandwidth edges for visualization
-        lower_edge = self.center_freq - (self.bandwidth / 2)
-        upper_edge = self.center_freq + (self.bandwidth / 2)
-
-        # Calculate the display frequency range
-        display_bandwidth = self.bandwidth * self.freq_display_multiplier
-        display_start = self.center_freq - (display_bandwidth / 2)
-        display_end = self.center_freq + (display_bandwidth / 2)
-
-        # Calculate position of bandwidth indicators as a percentage of the display width
-        lower_percent = (lower_edge - display_start) / display_bandwidth
-        upper_percent = (upper_edge - display_start) / display_bandwidth
-
-        # Convert to pixel positions (adding left margin since we're positioning on the full image)
-        lower_pixel = int(lower_percent * self.buffer_width) + self.left_margin
-        upper_pixel = int(upper_percent * self.buffer_width) + self.left_margin
-
-        # Draw the vertical lines for bandwidth limits
-        bandwidth_pen = QPen(QColor(255, 150, 0, 180))  # Orange with some transparency
-        bandwidth_pen.setWidth(1)
-        bandwidth_pen.setStyle(Qt.DashLine)
-        painter.setPen(bandwidth_pen)
-
-        # Draw the lines (already include left margin in pixel positions)
+        # Draw the vertical lines for bandwidth limits, positioned by _calculate_freq_mapping
+        painter.setPen(self._bandwidth_pen)
+        lower_pixel, upper_pixel = self._bandwidth_pixels
         painter.drawLine(lower_pixel, 0, lower_pixel, self.buffer_height)
         painter.drawLine(upper_pixel, 0, upper_pixel, self.buffer_height)
 
@@ -255,8 +281,7 @@ class WaterfallView(QWidget):
 
         # Resize waterfall image if needed
         if self.waterfall_image.width() != self.total_width:
-            self.waterfall_image = QImage(self.total_width, self.buffer_height, QImage.Format_RGB32)
-            self.waterfall_image.fill(self.bg_color)
+            self._allocate_buffer()
 
         # Update display settings
         ref_level = config.get('ui', 'spectrum_ref_level', -40)
@@ -308,3 +333,5 @@ class WaterfallView(QWidget):
             # Add the next bin for interpolation
             if bin_floor != bin_ceil and 0 <= bin_ceil < self.fft_size // 2:
                 self.pixel_to_bins[pixel_x].append((bin_ceil, weight_ceil))
+
+        self._pack_pixel_bins()